@@ -2,134 +2,219 @@
 Configuration settings for Multi-Task AI Assistant
 """
 
+import functools
 import os
-from dataclasses import dataclass
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping
 
-@dataclass
-class Config:
-    """Configuration class for the AI Assistant"""
-    
+# Environment variables read once at import time so repeated Config()
+# instantiation (or hot-path access) doesn't hit os.environ every time.
+_ENV_KEYS = ("OPENAI_API_KEY", "AZURE_TRANSLATOR_KEY", "AZURE_TRANSLATOR_REGION")
+_ENV_CACHE: dict = {key: os.environ.get(key, "") for key in _ENV_KEYS}
+
+# Path constants computed exactly once at import; importable directly
+# (from config import BASE_DIR) without instantiating the class.
+BASE_DIR: Final[str] = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR: Final[str] = os.path.join(BASE_DIR, "data")
+MODELS_DIR: Final[str] = os.path.join(BASE_DIR, "models")
+TEMP_DIR: Final[str] = os.path.join(BASE_DIR, "temp")
+MODEL_CACHE_DIR: Final[str] = os.path.join(MODELS_DIR, "cache")
+
+# Set once the directory layout has been created, so re-instantiating
+# Config doesn't repeat the scandir/mkdir work
+_DIRS_CREATED = False
+
+# Read-mostly defaults; Config instances copy these once in __init__
+_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType({
     # Application settings
-    APP_NAME: str = "Multi-Task AI Assistant"
-    VERSION: str = "1.0.0"
-    DEBUG: bool = False
-    
+    "APP_NAME": "Multi-Task AI Assistant",
+    "VERSION": "1.0.0",
+    "DEBUG": False,
+
     # Directories
-    BASE_DIR: str = os.path.dirname(os.path.abspath(__file__))
-    DATA_DIR: str = os.path.join(BASE_DIR, "data")
-    MODELS_DIR: str = os.path.join(BASE_DIR, "models")
-    TEMP_DIR: str = os.path.join(BASE_DIR, "temp")
-    
+    "BASE_DIR": BASE_DIR,
+    "DATA_DIR": DATA_DIR,
+    "MODELS_DIR": MODELS_DIR,
+    "TEMP_DIR": TEMP_DIR,
+
     # Wikipedia settings
-    WIKIPEDIA_LANGUAGE: str = "en"
-    WIKIPEDIA_MAX_RESULTS: int = 3
-    WIKIPEDIA_AUTO_SUGGEST: bool = True
-    
+    "WIKIPEDIA_LANGUAGE": "en",
+    "WIKIPEDIA_MAX_RESULTS": 3,
+    "WIKIPEDIA_AUTO_SUGGEST": True,
+
     # Document reader settings
-    SUPPORTED_DOC_FORMATS: list = None
-    MAX_FILE_SIZE_MB: int = 50
-    
+    "SUPPORTED_DOC_FORMATS": frozenset(('.txt', '.pdf', '.docx', '.doc', '.rtf')),
+    "MAX_FILE_SIZE_MB": 50,
+
     # Image analysis settings
-    SUPPORTED_IMAGE_FORMATS: list = None
-    IMAGE_MAX_SIZE_MB: int = 20
-    
+    "SUPPORTED_IMAGE_FORMATS": frozenset(('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff')),
+    "IMAGE_MAX_SIZE_MB": 20,
+
     # Video analysis settings
-    SUPPORTED_VIDEO_FORMATS: list = None
-    VIDEO_MAX_SIZE_MB: int = 100
-    VIDEO_FRAME_EXTRACT_INTERVAL: int = 30  # seconds
-    
+    "SUPPORTED_VIDEO_FORMATS": frozenset(('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv')),
+    "VIDEO_MAX_SIZE_MB": 100,
+    "VIDEO_FRAME_EXTRACT_INTERVAL": 30,  # seconds
+
     # Translation settings
-    DEFAULT_SOURCE_LANG: str = "auto"
-    DEFAULT_TARGET_LANG: str = "en"
-    TRANSLATION_SERVICE: str = "googletrans"  # or "azure", "openai"
-    
+    "DEFAULT_SOURCE_LANG": "auto",
+    "DEFAULT_TARGET_LANG": "en",
+    "TRANSLATION_SERVICE": "googletrans",  # or "azure", "openai"
+    "TRANSLATOR_WARMUP": True,  # prime DNS/TLS in the background on startup
+    "TRANSLATE_CONCURRENCY": 8,  # parallel requests cap for batch translation
+
     # Model settings
-    USE_GPU: bool = False
-    MODEL_CACHE_DIR: str = os.path.join(MODELS_DIR, "cache")
-    
-    # API Keys (to be set via environment variables)
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    AZURE_TRANSLATOR_KEY: str = os.getenv("AZURE_TRANSLATOR_KEY", "")
-    AZURE_TRANSLATOR_REGION: str = os.getenv("AZURE_TRANSLATOR_REGION", "")
-    
-    def __post_init__(self):
-        """Initialize default values after object creation"""
-        if self.SUPPORTED_DOC_FORMATS is None:
-            self.SUPPORTED_DOC_FORMATS = ['.txt', '.pdf', '.docx', '.doc', '.rtf']
-        
-        if self.SUPPORTED_IMAGE_FORMATS is None:
-            self.SUPPORTED_IMAGE_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff']
-        
-        if self.SUPPORTED_VIDEO_FORMATS is None:
-            self.SUPPORTED_VIDEO_FORMATS = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv']
-        
+    "USE_GPU": False,
+    "MODEL_CACHE_DIR": MODEL_CACHE_DIR,
+})
+
+
+class Config:
+    """Configuration class for the AI Assistant.
+
+    Plain slotted class instead of a dataclass: attributes are set once
+    in __init__ and then frozen, so reads are fixed-offset slot lookups
+    with no generated __init__/__eq__/__repr__ machinery.
+    """
+
+    __slots__ = tuple(_DEFAULTS) + _ENV_KEYS + (
+        '_FORMAT_SETS', '_MAX_SIZE_MAP', '_config_dict'
+    )
+
+    def __init__(self, **overrides):
+        for key in overrides:
+            if key not in _DEFAULTS and key not in _ENV_KEYS:
+                raise ValueError(f"Unknown configuration key: {key}")
+
+        setattr_ = object.__setattr__
+        for key, value in _DEFAULTS.items():
+            setattr_(self, key, overrides.get(key, value))
+
+        # API Keys (to be set via environment variables, cached at import time)
+        for key in _ENV_KEYS:
+            setattr_(self, key, overrides.get(key, _ENV_CACHE[key]))
+
+        # Dispatch table so is_file_supported does a single dict lookup
+        # followed by an O(1) frozenset membership probe
+        setattr_(self, '_FORMAT_SETS', {
+            "document": self.SUPPORTED_DOC_FORMATS,
+            "image": self.SUPPORTED_IMAGE_FORMATS,
+            "video": self.SUPPORTED_VIDEO_FORMATS
+        })
+
+        # Size limits keyed the same way, so validate_file doesn't rebuild
+        # a dict literal on every call
+        setattr_(self, '_MAX_SIZE_MAP', {
+            "document": self.MAX_FILE_SIZE_MB,
+            "image": self.IMAGE_MAX_SIZE_MB,
+            "video": self.VIDEO_MAX_SIZE_MB
+        })
+
+        setattr_(self, '_config_dict', None)
+
         # Create directories if they don't exist
         self._create_directories()
-    
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"Config is read-only; use replace({name}=...) to derive a new instance"
+        )
+
+    def __repr__(self):
+        return f"Config({self.APP_NAME!r}, version={self.VERSION!r})"
+
+    @classmethod
+    def refresh_env(cls):
+        """Re-read the cached environment variables (e.g. after os.environ changes)"""
+        for key in _ENV_KEYS:
+            _ENV_CACHE[key] = os.environ.get(key, "")
+
     def _create_directories(self):
-        """Create necessary directories"""
-        directories = [
-            self.DATA_DIR,
-            self.MODELS_DIR,
-            self.TEMP_DIR,
-            self.MODEL_CACHE_DIR
-        ]
-        
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
-    
+        """Create necessary directories (one scandir per parent, mkdir only the missing)"""
+        global _DIRS_CREATED
+        if _DIRS_CREATED:
+            return
+
+        needed_by_parent = {}
+        for directory in (self.DATA_DIR, self.MODELS_DIR, self.TEMP_DIR, self.MODEL_CACHE_DIR):
+            parent, name = os.path.split(directory)
+            needed_by_parent.setdefault(parent, []).append(name)
+
+        for parent, names in needed_by_parent.items():
+            try:
+                existing = {entry.name for entry in os.scandir(parent)}
+            except FileNotFoundError:
+                os.makedirs(parent, exist_ok=True)
+                existing = set()
+
+            for name in names:
+                if name not in existing:
+                    try:
+                        os.mkdir(os.path.join(parent, name))
+                    except FileExistsError:
+                        pass
+
+        _DIRS_CREATED = True
+
     def get_config_dict(self) -> Dict[str, Any]:
-        """Return configuration as dictionary"""
-        return {
-            key: value for key, value in self.__dict__.items()
-            if not key.startswith('_')
-        }
-    
-    def update_config(self, **kwargs):
-        """Update configuration values"""
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-            else:
+        """Return configuration as a read-only mapping (computed once per instance)"""
+        if self._config_dict is None:
+            object.__setattr__(self, '_config_dict', MappingProxyType({
+                key: getattr(self, key) for key in (*_DEFAULTS, *_ENV_KEYS)
+            }))
+        return self._config_dict
+
+    def replace(self, **kwargs) -> "Config":
+        """Return a new Config with the given values changed"""
+        merged = {key: getattr(self, key) for key in (*_DEFAULTS, *_ENV_KEYS)}
+        for key in kwargs:
+            if key not in merged:
                 raise ValueError(f"Unknown configuration key: {key}")
-    
-    def is_file_supported(self, file_path: str, file_type: str) -> bool:
-        """Check if file format is supported"""
-        file_ext = os.path.splitext(file_path)[1].lower()
-        
-        if file_type == "document":
-            return file_ext in self.SUPPORTED_DOC_FORMATS
-        elif file_type == "image":
-            return file_ext in self.SUPPORTED_IMAGE_FORMATS
-        elif file_type == "video":
-            return file_ext in self.SUPPORTED_VIDEO_FORMATS
-        else:
-            return False
-    
-    def get_file_size_mb(self, file_path: str) -> float:
-        """Get file size in MB"""
-        if os.path.exists(file_path):
-            return os.path.getsize(file_path) / (1024 * 1024)
-        return 0
-    
+        merged.update(kwargs)
+        return Config(**merged)
+
+    @staticmethod
+    def _ext(path: str) -> str:
+        """Lowercased extension of a path, without the splitext overhead"""
+        i = path.rfind('.')
+        return path[i:].lower() if i >= 0 else ''
+
+    def is_file_supported(self, file_path: str, file_type: str, _is_ext: bool = False) -> bool:
+        """Check if file format is supported (pass _is_ext=True for a precomputed extension)"""
+        file_ext = file_path if _is_ext else self._ext(file_path)
+        return file_ext in self._FORMAT_SETS.get(file_type, ())
+
+    def get_file_size_mb(self, file_path: str, stat_result: os.stat_result = None) -> float:
+        """Get file size in MB, reusing an existing stat result if provided"""
+        try:
+            st = stat_result if stat_result is not None else os.stat(file_path)
+        except OSError:
+            return 0
+        return st.st_size / (1024 * 1024)
+
     def validate_file(self, file_path: str, file_type: str) -> tuple[bool, str]:
-        """Validate file based on type and size"""
-        if not os.path.exists(file_path):
+        """Validate file based on type and size (single stat syscall)"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
             return False, "File does not exist"
-        
-        if not self.is_file_supported(file_path, file_type):
+
+        file_ext = self._ext(file_path)
+        if not self.is_file_supported(file_ext, file_type, _is_ext=True):
             return False, f"Unsupported {file_type} format"
-        
-        file_size = self.get_file_size_mb(file_path)
-        
-        max_size = {
-            "document": self.MAX_FILE_SIZE_MB,
-            "image": self.IMAGE_MAX_SIZE_MB,
-            "video": self.VIDEO_MAX_SIZE_MB
-        }.get(file_type, self.MAX_FILE_SIZE_MB)
-        
+
+        file_size = st.st_size / (1024 * 1024)
+
+        max_size = self._MAX_SIZE_MAP.get(file_type, self.MAX_FILE_SIZE_MB)
+
         if file_size > max_size:
             return False, f"File size ({file_size:.1f}MB) exceeds maximum allowed size ({max_size}MB)"
-        
-        return True, "File is valid"
\ No newline at end of file
+
+        return True, "File is valid"
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Shared Config instance; use this instead of Config() so the
+    __init__ work (frozensets, dispatch maps, directory checks)
+    happens exactly once per process."""
+    return Config()
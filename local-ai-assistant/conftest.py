@@ -0,0 +1,16 @@
+"""
+Pytest path setup for the project root
+
+Puts the project directory at the front of sys.path exactly once, so
+`import config` and `import scripts.X` resolve on the first entry
+instead of each test file appending a duplicate and forcing a longer
+linear scan. Path.resolve() runs once here rather than os.path.abspath
+per process start.
+"""
+
+import sys
+from pathlib import Path
+
+_ROOT = str(Path(__file__).parent.resolve())
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -6,10 +6,13 @@ Wikipedia queries, document processing, image analysis, video analysis, and tran
 """
 
 import gradio as gr
+import asyncio
+import functools
+import hashlib
 import os
+from concurrent.futures import ProcessPoolExecutor
 import sys
 import logging
-import tempfile
 import time
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
@@ -17,41 +20,340 @@ from typing import Dict, Any, Tuple, Optional
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import our modules
-from config import Config
-from scripts.wikipedia_query import WikipediaQuery
-from scripts.translator import Translator
-from scripts.document_reader import DocumentReader
-from scripts.image_analysis import ImageAnalysis
-from scripts.video_analysis import VideoAnalysis
+# Import our modules (the scripts.* modules are imported lazily, see
+# GradioAIAssistant's cached properties)
+from config import get_config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; production can set LOG_LEVEL=WARNING to skip
+# per-request INFO work entirely
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+
+# Shared stylesheet for the result cards, parsed once at client load.
+# The handlers emit only semantic class names, which keeps the per-request
+# payload small.
+CUSTOM_CSS = """
+.result-card { color: white; padding: 25px; border-radius: 15px; margin: 20px 0; }
+.result-card.compact { padding: 20px; margin: 0; }
+.grad-purple { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+.grad-pink { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
+.grad-blue { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); }
+.grad-sunset { background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); }
+.result-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin: 15px 0; }
+.result-grid.wide { grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); }
+.result-grid.two-col { grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0; }
+.result-cell { text-align: center; }
+.card-divider { border: 1px solid rgba(255,255,255,0.3); margin: 15px 0; }
+.detect-row { display: flex; justify-content: space-between; align-items: center; }
+.detect-row .value { font-size: 1.3em; margin: 5px 0; }
+.detect-row .right { text-align: right; }
+"""
+
+# Precompiled markdown/HTML output templates. Hoisted to module scope so
+# each request only pays for .format() substitution, not re-building the
+# multi-KB literals.
+_WIKI_HEADER_TPL = """
+# 🔍 Wikipedia Search Results
+**Query:** `{query}`  
+**Found:** {count} article(s)
+
+---
+"""
+
+_WIKI_ARTICLE_TPL = """
+## {index}. {title}
+
+📖 **Summary:**  
+{summary}...
+
+🔗 **[Read Full Article]({url})**
+
+---
+"""
+
+_TRANSLATE_TPL = """
+# 🌐 Translation Complete
+
+<div class="result-grid two-col">
+
+<div class="result-card compact grad-purple">
+<h3>🔤 Original</h3>
+<p><strong>Language:</strong> {source_language}</p>
+<p><em>"{original_text}"</em></p>
+</div>
+
+<div class="result-card compact grad-pink">
+<h3>✨ Translated</h3>
+<p><strong>Language:</strong> {target_language}</p>
+<p><em>"{translated_text}"</em></p>
+</div>
+
+</div>
+
+**Service:** {service} | **Time:** {now}
+"""
+
+_DETECT_TPL = """
+# 🔍 Language Detection Complete
+
+<div class="result-card grad-blue">
+    <h3>🎯 Detection Results</h3>
+    <p><strong>Text Sample:</strong> <em>"{text_sample}"</em></p>
+    <hr class="card-divider">
+    <div class="detect-row">
+        <div>
+            <h4>🌍 Detected Language</h4>
+            <p class="value">{language_name} ({detected_language})</p>
+        </div>
+        <div class="right">
+            <h4>📊 Confidence</h4>
+            <p class="value">{confidence}</p>
+        </div>
+    </div>
+</div>
+
+**Analysis Time:** {now}
+"""
+
+_DOCUMENT_TPL = """
+# 📄 Document Analysis Complete
+
+<div class="result-card grad-sunset">
+    <h3>📊 Document Overview</h3>
+    <div class="result-grid wide">
+        <div class="result-cell">
+            <h4>📁 File</h4>
+            <p>{file_name}</p>
+        </div>
+        <div class="result-cell">
+            <h4>📋 Type</h4>
+            <p>{file_type}</p>
+        </div>
+        <div class="result-cell">
+            <h4>💾 Size</h4>
+            <p>{file_size_mb:.2f} MB</p>
+        </div>
+        <div class="result-cell">
+            <h4>📄 Pages</h4>
+            <p>{page_count}</p>
+        </div>
+    </div>
+</div>
+
+## 📖 Content Preview
+```
+{preview}
+```
+
+**Extraction Time:** {now} | **Characters:** {char_count:,}
+"""
+
+_IMAGE_TPL = """
+# 🖼️ Image Analysis Complete
+
+<div class="result-card grad-purple">
+    <h3>🎨 Image Properties</h3>
+    <div class="result-grid">
+        <div class="result-cell">
+            <h4>📐 Dimensions</h4>
+            <p>{width} × {height}</p>
+        </div>
+        <div class="result-cell">
+            <h4>🎭 Format</h4>
+            <p>{format}</p>
+        </div>
+        <div class="result-cell">
+            <h4>🌈 Mode</h4>
+            <p>{mode}</p>
+        </div>
+        <div class="result-cell">
+            <h4>💾 Size</h4>
+            <p>{file_size_mb:.2f} MB</p>
+        </div>
+    </div>
+</div>
+
+## 🎨 Color Analysis
+"""
+
+_IMAGE_COLOR_TPL = """
+- **✨ Average Brightness:** {average_brightness}
+- **🌈 Dominant Colors:** {dominant_count} detected
+- **📊 Color Diversity:** {color_diversity}
+"""
+
+_VIDEO_TPL = """
+# 🎥 Video Analysis Complete
+
+<div class="result-card grad-pink">
+    <h3>🎬 Video Properties</h3>
+    <div class="result-grid">
+        <div class="result-cell">
+            <h4>⏱️ Duration</h4>
+            <p>{duration}</p>
+        </div>
+        <div class="result-cell">
+            <h4>📺 Resolution</h4>
+            <p>{resolution}</p>
+        </div>
+        <div class="result-cell">
+            <h4>🎞️ FPS</h4>
+            <p>{fps}</p>
+        </div>
+        <div class="result-cell">
+            <h4>💾 Size</h4>
+            <p>{file_size_mb:.2f} MB</p>
+        </div>
+        <div class="result-cell">
+            <h4>🖼️ Frames</h4>
+            <p>{frame_count}</p>
+        </div>
+    </div>
+</div>
+
+## 🎵 Audio Analysis
+"""
+
+_VIDEO_AUDIO_TPL = """
+✅ **Audio Track Found**
+- **Sample Rate:** {sample_rate} Hz
+- **Channels:** {channels}
+- **Duration:** {duration} seconds
+"""
+
+
+# Worker-side analyzers, built once per pool process. Top-level functions
+# so ProcessPoolExecutor can pickle them.
+_worker_image_analyzer = None
+_worker_video_analyzer = None
+
+
+def _analyze_image_worker(image_path: str) -> Dict:
+    global _worker_image_analyzer
+    if _worker_image_analyzer is None:
+        from scripts.image_analysis import ImageAnalysis
+        _worker_image_analyzer = ImageAnalysis()
+    return _worker_image_analyzer.analyze_image(image_path)
+
+
+def _analyze_video_worker(video_path: str) -> Dict:
+    global _worker_video_analyzer
+    if _worker_video_analyzer is None:
+        from scripts.video_analysis import VideoAnalysis
+        _worker_video_analyzer = VideoAnalysis()
+    return _worker_video_analyzer.analyze_video(video_path)
+
+
+# Language options for translation, frozen at module scope with a
+# precomputed source lookup (including the auto-detect entry) so the
+# handlers do a single dict.get per call
+_LANGUAGES = {
+    "🇹🇷 Turkish": "tr", "🇺🇸 English": "en", "🇩🇪 German": "de", "🇫🇷 French": "fr",
+    "🇪🇸 Spanish": "es", "🇮🇹 Italian": "it", "🇷🇺 Russian": "ru", "🇨🇳 Chinese": "zh",
+    "🇯🇵 Japanese": "ja", "🇰🇷 Korean": "ko", "🇸🇦 Arabic": "ar", "🇵🇹 Portuguese": "pt",
+    "🇳🇱 Dutch": "nl", "🇸🇪 Swedish": "sv", "🇵🇱 Polish": "pl", "🇨🇿 Czech": "cs"
+}
+_ALL_SOURCES = {"🤖 Auto-detect": "auto", **_LANGUAGES}
+
+
+# Suffixes the document tab accepts; shared by the gr.File component and
+# the O(1) prevalidation in process_document
+_ALLOWED_DOC_SUFFIXES = (".pdf", ".doc", ".docx", ".txt", ".md")
+_ALLOWED_DOC_SUFFIX_SET = frozenset(_ALLOWED_DOC_SUFFIXES)
+
+
+def _truncate(s: str, n: int) -> str:
+    """Clamp s to n characters, appending an ellipsis when cut"""
+    return s if len(s) <= n else s[:n] + "..."
+
 class GradioAIAssistant:
+    _SEARCH_CACHE_SIZE = 512
+    _TRANSLATE_CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize the Gradio AI Assistant"""
-        self.config = Config()
-        
-        # Initialize modules
-        try:
-            self.wikipedia = WikipediaQuery()
-            self.translator = Translator()
-            self.doc_reader = DocumentReader()
-            self.image_analyzer = ImageAnalysis()
-            self.video_analyzer = VideoAnalysis()
-            logger.info("All modules initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing modules: {e}")
+        self.config = get_config()
+
+        # Repeated identical queries (e.g. the example buttons) skip the
+        # upstream round-trip entirely
+        self._search_cache = {}
+        # Keyed on a 16-byte digest of the text so long inputs don't pin
+        # megabytes in the cache key; insertion order doubles as LRU order
+        self._translate_cache = {}
+
+    def _cached_search(self, query: str, max_results: int) -> Dict:
+        # Only successful responses are memoized: a transient network
+        # error must not pin the query to "failed" for the process
+        # lifetime
+        key = (query, max_results)
+        cache = self._search_cache
+        result = cache.pop(key, None)
+        if result is None:
+            result = self.wikipedia.search(query, max_results=max_results)
+            if not result.get("success"):
+                return result
+            if len(cache) >= self._SEARCH_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+        cache[key] = result
+        return result
+
+    def _cached_translate(self, text: str, target_lang: str, source_lang: str) -> Dict:
+        key = (hashlib.blake2b(text.encode(), digest_size=16).digest(),
+               target_lang, source_lang)
+        cache = self._translate_cache
+        result = cache.pop(key, None)
+        if result is None:
+            result = self.translator.translate(text, target_lang, source_lang)
+            if not result.get("success"):
+                return result
+            if len(cache) >= self._TRANSLATE_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+        cache[key] = result
+        return result
+
+    # Each module is imported and constructed on first use, so cold start
+    # (and Gradio hot-reload) doesn't pay for cv2/moviepy/PIL imports the
+    # user may never touch.
+    @functools.cached_property
+    def wikipedia(self):
+        from scripts.wikipedia_query import WikipediaQuery
+        return WikipediaQuery()
+
+    @functools.cached_property
+    def translator(self):
+        from scripts.translator import Translator
+        return Translator()
+
+    @functools.cached_property
+    def doc_reader(self):
+        from scripts.document_reader import DocumentReader
+        return DocumentReader()
+
+    @functools.cached_property
+    def image_analyzer(self):
+        from scripts.image_analysis import ImageAnalysis
+        return ImageAnalysis()
+
+    @functools.cached_property
+    def video_analyzer(self):
+        from scripts.video_analysis import VideoAnalysis
+        return VideoAnalysis()
+
+    @functools.cached_property
+    def _cpu_pool(self):
+        # Image/video analysis is CPU-bound; a process pool sidesteps GIL
+        # contention with the I/O handlers. Built lazily so processes are
+        # only spawned once a media tab is actually used.
+        return ProcessPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2))
     
     def search_wikipedia(self, query: str, max_results: int = 3) -> Tuple[str, str]:
         """Search Wikipedia and return formatted results with status"""
-        if not query.strip():
+        if not query or query.isspace():
             return "❌ Error", "Please enter a search query."
         
         try:
-            result = self.wikipedia.search(query, max_results=max_results)
+            result = self._cached_search(query, max_results)
             
             if not result["success"]:
                 return "❌ Error", f"Error: {result['message']}"
@@ -59,79 +361,57 @@ class GradioAIAssistant:
             if not result["results"]:
                 return "⚠️ Warning", f"No results found for '{query}'"
             
-            # Format results with modern styling
-            output = f"""
-# 🔍 Wikipedia Search Results
-**Query:** `{query}`  
-**Found:** {len(result["results"])} article(s)
-
----
-"""
-            
+            # Format results with modern styling; accumulate in a list and
+            # join once instead of growing a string per article
+            parts = [_WIKI_HEADER_TPL.format(query=query, count=len(result["results"]))]
+            append = parts.append
             for i, article in enumerate(result["results"], 1):
-                output += f"""
-## {i}. {article['title']}
-
-📖 **Summary:**  
-{article['summary'][:400]}...
-
-🔗 **[Read Full Article]({article['url']})**
-
----
-"""
+                append(_WIKI_ARTICLE_TPL.format(
+                    index=i,
+                    title=article['title'],
+                    summary=article['summary'][:400],
+                    url=article['url']
+                ))
             
-            return "✅ Success", output
+            return "✅ Success", "".join(parts)
             
         except Exception as e:
-            logger.error(f"Wikipedia search error: {e}")
+            logger.error("Wikipedia search error: %s", e)
             return "❌ Error", f"Error searching Wikipedia: {str(e)}"
     
     def translate_text(self, text: str, target_lang: str, source_lang: str = "auto") -> Tuple[str, str]:
         """Translate text between languages with modern output"""
-        if not text.strip():
+        if not text or text.isspace():
             return "❌ Error", "Please enter text to translate."
         
         if not target_lang:
             return "❌ Error", "Please select a target language."
         
         try:
-            result = self.translator.translate(text, target_lang, source_lang)
+            result = self._cached_translate(text, target_lang, source_lang)
             
             if not result["success"]:
                 return "❌ Error", f"Translation Error: {result['message']}"
             
             # Modern translation output with cards
-            output = f"""
-# 🌐 Translation Complete
-
-<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0;">
-
-<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 15px;">
-<h3>🔤 Original</h3>
-<p><strong>Language:</strong> {result.get('source_language', 'auto').upper()}</p>
-<p><em>"{result['original_text']}"</em></p>
-</div>
-
-<div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 20px; border-radius: 15px;">
-<h3>✨ Translated</h3>
-<p><strong>Language:</strong> {result['target_language'].upper()}</p>
-<p><em>"{result['translated_text']}"</em></p>
-</div>
-
-</div>
-
-**Service:** {result.get('service', 'Unknown')} | **Time:** {time.strftime('%H:%M:%S')}
-"""
+            output = _TRANSLATE_TPL.format(
+                source_language=result.get('source_language', 'auto').upper(),
+                original_text=result['original_text'],
+                target_language=result['target_language'].upper(),
+                translated_text=result['translated_text'],
+                service=result.get('service', 'Unknown'),
+                now=time.strftime('%H:%M:%S')
+            )
             
             return "✅ Success", output
             
         except Exception as e:
-            logger.error(f"Translation error: {e}")
+            logger.error("Translation error: %s", e)
             return "❌ Error", f"Error translating text: {str(e)}"
     
     def detect_language(self, text: str) -> Tuple[str, str]:
         """Detect the language of given text with modern output"""
-        if not text.strip():
+        if not text or text.isspace():
             return "❌ Error", "Please enter text for language detection."
         
         try:
@@ -141,32 +421,18 @@ class GradioAIAssistant:
                 return "❌ Error", f"Detection Error: {result['message']}"
             
             # Modern detection output
-            output = f"""
-# 🔍 Language Detection Complete
-
-<div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; padding: 25px; border-radius: 15px; margin: 20px 0;">
-    <h3>🎯 Detection Results</h3>
-    <p><strong>Text Sample:</strong> <em>"{text[:150]}{'...' if len(text) > 150 else ''}"</em></p>
-    <hr style="border: 1px solid rgba(255,255,255,0.3); margin: 15px 0;">
-    <div style="display: flex; justify-content: space-between; align-items: center;">
-        <div>
-            <h4>🌍 Detected Language</h4>
-            <p style="font-size: 1.3em; margin: 5px 0;">{result.get('language_name', 'Unknown')} ({result.get('detected_language', 'unknown')})</p>
-        </div>
-        <div style="text-align: right;">
-            <h4>📊 Confidence</h4>
-            <p style="font-size: 1.3em; margin: 5px 0;">{result.get('confidence', 0):.1%}</p>
-        </div>
-    </div>
-</div>
-
-**Analysis Time:** {time.strftime('%H:%M:%S')}
-"""
+            output = _DETECT_TPL.format(
+                text_sample=_truncate(text, 150),
+                language_name=result.get('language_name', 'Unknown'),
+                detected_language=result.get('detected_language', 'unknown'),
+                confidence=format(result.get('confidence', 0), '.1%'),
+                now=time.strftime('%H:%M:%S')
+            )
             
             return "✅ Success", output
             
         except Exception as e:
-            logger.error(f"Language detection error: {e}")
+            logger.error("Language detection error: %s", e)
             return "❌ Error", f"Error detecting language: {str(e)}"
     
     def process_document(self, file) -> Tuple[str, str]:
@@ -178,6 +444,11 @@ class GradioAIAssistant:
             # Get file path
             file_path = file.name if hasattr(file, 'name') else str(file)
             
+            # Reject unsupported types before touching any document backend
+            suffix = Path(file_path).suffix.lower()
+            if suffix not in _ALLOWED_DOC_SUFFIX_SET:
+                return "❌ Error", f"Unsupported document type: {suffix or '(no extension)'}"
+            
             result = self.doc_reader.read_document(file_path)
             
             if not result["success"]:
@@ -187,43 +458,20 @@ class GradioAIAssistant:
             metadata = result.get("metadata", {})
             
             # Modern document analysis output
-            output = f"""
-# 📄 Document Analysis Complete
-
-<div style="background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); color: white; padding: 25px; border-radius: 15px; margin: 20px 0;">
-    <h3>📊 Document Overview</h3>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 15px 0;">
-        <div style="text-align: center;">
-            <h4>📁 File</h4>
-            <p>{Path(file_path).name}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>📋 Type</h4>
-            <p>{metadata.get('file_type', 'Unknown')}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>💾 Size</h4>
-            <p>{metadata.get('file_size_mb', 0):.2f} MB</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>📄 Pages</h4>
-            <p>{metadata.get('page_count', 'N/A')}</p>
-        </div>
-    </div>
-</div>
-
-## 📖 Content Preview
-```
-{content[:1500]}{'...' if len(content) > 1500 else ''}
-```
-
-**Extraction Time:** {time.strftime('%H:%M:%S')} | **Characters:** {len(content):,}
-"""
+            output = _DOCUMENT_TPL.format(
+                file_name=Path(file_path).name,
+                file_type=metadata.get('file_type', 'Unknown'),
+                file_size_mb=metadata.get('file_size_mb', 0),
+                page_count=metadata.get('page_count', 'N/A'),
+                preview=_truncate(content, 1500),
+                now=time.strftime('%H:%M:%S'),
+                char_count=len(content)
+            )
             
             return "✅ Success", output
             
         except Exception as e:
-            logger.error(f"Document processing error: {e}")
+            logger.error("Document processing error: %s", e)
             return "❌ Error", f"Error processing document: {str(e)}"
     
     def analyze_image(self, image) -> Tuple[str, str]:
@@ -232,17 +480,11 @@ class GradioAIAssistant:
             return "❌ Error", "Please upload an image file."
         
         try:
-            # Save temporary file if needed
-            if hasattr(image, 'name'):
-                image_path = image.name
-            else:
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as tmp:
-                    if hasattr(image, 'save'):
-                        image.save(tmp.name)
-                    image_path = tmp.name
+            # The image tab uses gr.Image(type="filepath"), so the input is
+            # already a path on disk — no tempfile re-encode round-trip
+            image_path = image.name if hasattr(image, 'name') else str(image)
             
-            result = self.image_analyzer.analyze_image(image_path)
+            result = self._cpu_pool.submit(_analyze_image_worker, image_path).result()
             
             if not result["success"]:
                 return "❌ Error", f"Image Analysis Error: {result['message']}"
@@ -252,49 +494,29 @@ class GradioAIAssistant:
             color_analysis = analysis.get("color_analysis", {})
             
             # Modern image analysis output
-            output = f"""
-# 🖼️ Image Analysis Complete
-
-<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 15px; margin: 20px 0;">
-    <h3>🎨 Image Properties</h3>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin: 15px 0;">
-        <div style="text-align: center;">
-            <h4>📐 Dimensions</h4>
-            <p>{basic_info.get('width', 'N/A')} × {basic_info.get('height', 'N/A')}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>🎭 Format</h4>
-            <p>{basic_info.get('format', 'Unknown')}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>🌈 Mode</h4>
-            <p>{basic_info.get('mode', 'Unknown')}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>💾 Size</h4>
-            <p>{basic_info.get('file_size_mb', 0):.2f} MB</p>
-        </div>
-    </div>
-</div>
-
-## 🎨 Color Analysis
-"""
+            parts = [_IMAGE_TPL.format(
+                width=basic_info.get('width', 'N/A'),
+                height=basic_info.get('height', 'N/A'),
+                format=basic_info.get('format', 'Unknown'),
+                mode=basic_info.get('mode', 'Unknown'),
+                file_size_mb=basic_info.get('file_size_mb', 0)
+            )]
             
             if color_analysis:
-                output += f"""
-- **✨ Average Brightness:** {color_analysis.get('average_brightness', 'N/A')}
-- **🌈 Dominant Colors:** {len(color_analysis.get('dominant_colors', []))} detected
-- **📊 Color Diversity:** {color_analysis.get('color_diversity', 'N/A')}
-"""
+                parts.append(_IMAGE_COLOR_TPL.format(
+                    average_brightness=color_analysis.get('average_brightness', 'N/A'),
+                    dominant_count=len(color_analysis.get('dominant_colors', [])),
+                    color_diversity=color_analysis.get('color_diversity', 'N/A')
+                ))
             else:
-                output += "Color analysis not available"
+                parts.append("Color analysis not available")
             
-            output += f"\n\n**Analysis Time:** {time.strftime('%H:%M:%S')}"
+            parts.append(f"\n\n**Analysis Time:** {time.strftime('%H:%M:%S')}")
             
-            return "✅ Success", output
+            return "✅ Success", "".join(parts)
             
         except Exception as e:
-            logger.error(f"Image analysis error: {e}")
+            logger.error("Image analysis error: %s", e)
             return "❌ Error", f"Error analyzing image: {str(e)}"
     
     def analyze_video(self, video) -> Tuple[str, str]:
@@ -306,7 +528,7 @@ class GradioAIAssistant:
             # Get video path
             video_path = video.name if hasattr(video, 'name') else str(video)
             
-            result = self.video_analyzer.analyze_video(video_path)
+            result = self._cpu_pool.submit(_analyze_video_worker, video_path).result()
             
             if not result["success"]:
                 return "❌ Error", f"Video Analysis Error: {result['message']}"
@@ -316,73 +538,48 @@ class GradioAIAssistant:
             audio_info = analysis.get("audio_analysis", {})
             
             # Modern video analysis output
-            output = f"""
-# 🎥 Video Analysis Complete
-
-<div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 25px; border-radius: 15px; margin: 20px 0;">
-    <h3>🎬 Video Properties</h3>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin: 15px 0;">
-        <div style="text-align: center;">
-            <h4>⏱️ Duration</h4>
-            <p>{basic_info.get('duration_formatted', 'N/A')}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>📺 Resolution</h4>
-            <p>{basic_info.get('resolution', 'N/A')}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>🎞️ FPS</h4>
-            <p>{basic_info.get('fps', 'N/A')}</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>💾 Size</h4>
-            <p>{basic_info.get('file_size_mb', 0):.2f} MB</p>
-        </div>
-        <div style="text-align: center;">
-            <h4>🖼️ Frames</h4>
-            <p>{basic_info.get('frame_count', 'N/A'):,}</p>
-        </div>
-    </div>
-</div>
-
-## 🎵 Audio Analysis
-"""
+            frame_count = basic_info.get('frame_count', 'N/A')
+            parts = [_VIDEO_TPL.format(
+                duration=basic_info.get('duration_formatted', 'N/A'),
+                resolution=basic_info.get('resolution', 'N/A'),
+                fps=basic_info.get('fps', 'N/A'),
+                file_size_mb=basic_info.get('file_size_mb', 0),
+                frame_count=format(frame_count, ',') if isinstance(frame_count, int) else frame_count
+            )]
             
             if audio_info.get('has_audio'):
-                output += f"""
-✅ **Audio Track Found**
-- **Sample Rate:** {audio_info.get('sample_rate', 'N/A')} Hz
-- **Channels:** {audio_info.get('channels', 'N/A')}
-- **Duration:** {audio_info.get('duration', 'N/A')} seconds
-"""
+                parts.append(_VIDEO_AUDIO_TPL.format(
+                    sample_rate=audio_info.get('sample_rate', 'N/A'),
+                    channels=audio_info.get('channels', 'N/A'),
+                    duration=audio_info.get('duration', 'N/A')
+                ))
             else:
-                output += "❌ **No Audio Track**"
+                parts.append("❌ **No Audio Track**")
             
-            output += f"\n\n**Analysis Time:** {time.strftime('%H:%M:%S')}"
+            parts.append(f"\n\n**Analysis Time:** {time.strftime('%H:%M:%S')}")
             
-            return "✅ Success", output
+            return "✅ Success", "".join(parts)
             
         except Exception as e:
-            logger.error(f"Video analysis error: {e}")
+            logger.error("Video analysis error: %s", e)
             return "❌ Error", f"Error analyzing video: {str(e)}"
 
+@functools.lru_cache(maxsize=1)
+def get_assistant() -> GradioAIAssistant:
+    """Shared assistant instance, built once per process"""
+    return GradioAIAssistant()
+
+
 def create_gradio_interface():
     """Create and configure the modern Gradio interface"""
     
     # Initialize the assistant
-    assistant = GradioAIAssistant()
-    
-    # Language options for translation
-    languages = {
-        "🇹🇷 Turkish": "tr", "🇺🇸 English": "en", "🇩🇪 German": "de", "🇫🇷 French": "fr",
-        "🇪🇸 Spanish": "es", "🇮🇹 Italian": "it", "🇷🇺 Russian": "ru", "🇨🇳 Chinese": "zh",
-        "🇯🇵 Japanese": "ja", "🇰🇷 Korean": "ko", "🇸🇦 Arabic": "ar", "🇵🇹 Portuguese": "pt",
-        "🇳🇱 Dutch": "nl", "🇸🇪 Swedish": "sv", "🇵🇱 Polish": "pl", "🇨🇿 Czech": "cs"
-    }
+    assistant = get_assistant()
     
     # Create the interface with modern theme
     with gr.Blocks(
         title="🤖 AI Assistant Pro", 
+        css=CUSTOM_CSS,
         theme=gr.themes.Soft(
             primary_hue=gr.themes.colors.purple,
             secondary_hue=gr.themes.colors.pink,
@@ -463,12 +660,12 @@ def create_gradio_interface():
                         with gr.Row():
                             source_lang = gr.Dropdown(
                                 label="🔤 From Language",
-                                choices=["🤖 Auto-detect"] + list(languages.keys()),
+                                choices=list(_ALL_SOURCES.keys()),
                                 value="🤖 Auto-detect"
                             )
                             target_lang = gr.Dropdown(
                                 label="🎯 To Language",
-                                choices=list(languages.keys()),
+                                choices=list(_LANGUAGES.keys()),
                                 value="🇺🇸 English"
                             )
                         
@@ -510,7 +707,7 @@ def create_gradio_interface():
                     with gr.Column():
                         doc_file = gr.File(
                             label="📎 Drop your document here",
-                            file_types=[".pdf", ".doc", ".docx", ".txt", ".md"]
+                            file_types=list(_ALLOWED_DOC_SUFFIXES)
                         )
                         doc_button = gr.Button(
                             "🔬 Analyze Document", 
@@ -593,81 +790,143 @@ def create_gradio_interface():
         </div>
         """)
         
-        # Event handlers with status updates
-        def translate_wrapper(text, source, target):
-            source_code = "auto" if "Auto-detect" in source else languages.get(source, "auto")
-            target_code = languages.get(target, "en")
-            status, result = assistant.translate_text(text, target_code, source_code)
-            return status, result
+        # Event handlers with status updates. Async so the blocking work
+        # runs on a worker thread and the event loop stays free to overlap
+        # other requests.
+        async def translate_wrapper(texts, sources, targets):
+            # Batched by the Gradio queue: concurrent users arrive as lists
+            def run_batch():
+                statuses, outputs = [], []
+                for text, source, target in zip(texts, sources, targets):
+                    source_code = _ALL_SOURCES.get(source, "auto")
+                    target_code = _LANGUAGES.get(target, "en")
+                    status, result = assistant.translate_text(text, target_code, source_code)
+                    statuses.append(status)
+                    outputs.append(result)
+                return statuses, outputs
+            return await asyncio.to_thread(run_batch)
+        
+        async def detect_wrapper(text):
+            yield "⏳ Detecting...", ""
+            yield await asyncio.to_thread(assistant.detect_language, text)
         
-        def search_wrapper(query, max_results):
-            status, result = assistant.search_wikipedia(query, max_results)
-            return status, result
+        async def search_wrapper(queries, maxes):
+            # Batched by the Gradio queue; fan the per-query searches out
+            # concurrently so the batch costs one round-trip of latency
+            results = await asyncio.gather(*(
+                asyncio.to_thread(assistant.search_wikipedia, query, max_results)
+                for query, max_results in zip(queries, maxes)
+            ))
+            statuses = [status for status, _ in results]
+            outputs = [output for _, output in results]
+            return statuses, outputs
         
-        def doc_wrapper(file):
+        # Generator handlers: yield a status immediately so time-to-first
+        # -byte is milliseconds even when the analysis itself is slow.
+        # (The wiki/translate handlers stay plain coroutines — Gradio can't
+        # batch generator handlers.)
+        async def doc_wrapper(file):
             if file is None:
-                return "❌ Error", "Please upload a file"
-            status, result = assistant.process_document(file)
-            return status, result
+                yield "❌ Error", "Please upload a file"
+                return
+            yield "⏳ Extracting...", ""
+            yield await asyncio.to_thread(assistant.process_document, file)
         
-        def image_wrapper(image):
+        async def image_wrapper(image):
             if image is None:
-                return "❌ Error", "Please upload an image"
-            status, result = assistant.analyze_image(image)
-            return status, result
+                yield "❌ Error", "Please upload an image"
+                return
+            yield "⏳ Analyzing image...", ""
+            yield await asyncio.to_thread(assistant.analyze_image, image)
         
-        def video_wrapper(video):
+        async def video_wrapper(video):
             if video is None:
-                return "❌ Error", "Please upload a video"
-            status, result = assistant.analyze_video(video)
-            return status, result
+                yield "❌ Error", "Please upload a video"
+                return
+            yield "⏳ Analyzing video...", ""
+            yield await asyncio.to_thread(assistant.analyze_video, video)
         
         # Connect events
+        # I/O-bound handlers (network calls) share a wide pool; CPU-heavy
+        # media handlers get their own small pool so they can't starve it
         wiki_button.click(
             search_wrapper,
             inputs=[wiki_query, wiki_results],
-            outputs=[wiki_status, wiki_output]
+            outputs=[wiki_status, wiki_output],
+            concurrency_id="io",
+            batch=True,
+            max_batch_size=8
         )
         
         translate_button.click(
             translate_wrapper,
             inputs=[translate_text, source_lang, target_lang],
-            outputs=[translate_status, translate_output]
+            outputs=[translate_status, translate_output],
+            concurrency_id="io",
+            batch=True,
+            max_batch_size=8
         )
         
         detect_button.click(
-            assistant.detect_language,
+            detect_wrapper,
             inputs=translate_text,
-            outputs=[translate_status, translate_output]
+            outputs=[translate_status, translate_output],
+            concurrency_id="io"
         )
         
         doc_button.click(
             doc_wrapper,
             inputs=doc_file,
-            outputs=[doc_status, doc_output]
+            outputs=[doc_status, doc_output],
+            concurrency_id="cpu",
+            concurrency_limit=2
         )
         
         image_button.click(
             image_wrapper,
             inputs=image_file,
-            outputs=[image_status, image_output]
+            outputs=[image_status, image_output],
+            concurrency_id="cpu",
+            concurrency_limit=2
         )
         
         video_button.click(
             video_wrapper,
             inputs=video_file,
-            outputs=[video_status, video_output]
+            outputs=[video_status, video_output],
+            concurrency_id="cpu",
+            concurrency_limit=2
         )
     
+    # Queue blocking handlers instead of head-of-line blocking Starlette's
+    # default threadpool
+    interface.queue(default_concurrency_limit=8, max_size=64)
+    
     return interface
 
 if __name__ == "__main__":
+    # Debug mode (tracebacks to clients, access logging, auto-open browser)
+    # is opt-in; production runs lean by default
+    DEBUG = os.environ.get("GRADIO_DEBUG") == "1"
+
     print("🚀 Starting AI Assistant Pro...")
     print("🔧 Initializing modules...")
     
     # Create and launch the interface
     try:
         interface = create_gradio_interface()
+        
+        # Serialize API responses with orjson when available (~3x faster
+        # than stdlib json on the multi-KB analysis payloads). The class
+        # must go through app_kwargs: the FastAPI app doesn't exist until
+        # launch(), and routes bind their response class at registration.
+        try:
+            import orjson  # noqa: F401 -- ORJSONResponse needs it at runtime
+            from fastapi.responses import ORJSONResponse
+            app_kwargs = {"default_response_class": ORJSONResponse}
+        except ImportError:
+            app_kwargs = None
+
         print("✅ Interface created successfully!")
         print("🌐 Launching web application...")
         print("📱 Access your AI Assistant at: http://localhost:7860")
@@ -678,11 +937,13 @@ if __name__ == "__main__":
         interface.launch(
             server_name="0.0.0.0",  # Allow external connections
             server_port=7860,
+            max_threads=40,
             share=False,  # Set to True for public ngrok link
-            debug=True,
-            show_error=True,
-            quiet=False,
-            inbrowser=True  # Automatically open browser
+            debug=DEBUG,
+            show_error=DEBUG,
+            quiet=not DEBUG,
+            inbrowser=DEBUG,
+            app_kwargs=app_kwargs
         )
         
     except Exception as e:
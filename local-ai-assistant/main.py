@@ -7,7 +7,7 @@ Main entry point for the application
 import sys
 import os
 import argparse
-from config import Config
+from config import get_config
 from scripts.wikipedia_query import WikipediaQuery
 from scripts.document_reader import DocumentReader
 from scripts.image_analysis import ImageAnalysis
@@ -16,7 +16,7 @@ from scripts.translator import Translator
 
 class MultiTaskAIAssistant:
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.wikipedia = WikipediaQuery()
         self.document_reader = DocumentReader()
         self.image_analysis = ImageAnalysis()
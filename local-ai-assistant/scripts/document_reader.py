@@ -3,22 +3,53 @@ Document Reader Module
 Handles reading and processing various document formats
 """
 
+import collections
 import os
 import logging
+import re
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Union
 import PyPDF2
 from docx import Document
-import chardet
+from chardet.universaldetector import UniversalDetector
 import sys
 
+# Try to import PyMuPDF for fast C-backed PDF text extraction,
+# fall back to PyPDF2 if not available
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 # Add parent directory to path for importing config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import Config
+from config import get_config
+
+# RTF cleanup patterns, compiled once at import. Byte-level patterns let
+# _read_rtf strip markup before decoding; commands and braces are fused
+# into a single alternation so the content is scanned once less.
+_RTF_MARKUP = re.compile(rb'\\[a-z]+\d*\s?|[{}]')
+_RTF_WS = re.compile(rb'\s+')
 
 class DocumentReader:
+    # Parsed results kept per (path, mtime_ns, size); a changed file gets a
+    # new key, so stale entries simply age out of the LRU
+    _CACHE_SIZE = 128
+
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = logging.getLogger(__name__)
+        self._result_cache = collections.OrderedDict()
+
+    def _cache_key(self, file_path: str):
+        """Cache key that changes whenever the file content can have changed"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, st.st_mtime_ns, st.st_size)
     
     def read_document(self, file_path: str) -> Dict:
         """
@@ -39,7 +70,14 @@ class DocumentReader:
                     "message": message,
                     "content": ""
                 }
-            
+
+            # Reading is deterministic in the file content, so repeat calls
+            # on an unchanged file are served from the cache
+            cache_key = self._cache_key(file_path)
+            if cache_key in self._result_cache:
+                self._result_cache.move_to_end(cache_key)
+                return self._result_cache[cache_key]
+
             file_ext = os.path.splitext(file_path)[1].lower()
             
             if file_ext == '.pdf':
@@ -66,8 +104,8 @@ class DocumentReader:
             
             # Get file metadata
             metadata = self._get_file_metadata(file_path)
-            
-            return {
+
+            result = {
                 "success": True,
                 "file_path": file_path,
                 "file_type": file_ext,
@@ -76,6 +114,13 @@ class DocumentReader:
                 "word_count": len(content.split()),
                 "character_count": len(content)
             }
+
+            if cache_key is not None:
+                self._result_cache[cache_key] = result
+                if len(self._result_cache) > self._CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+            return result
             
         except Exception as e:
             self.logger.error(f"Error reading document '{file_path}': {e}")
@@ -86,17 +131,44 @@ class DocumentReader:
             }
     
     def _read_pdf(self, file_path: str) -> Optional[str]:
-        """Read PDF file content"""
+        """Read PDF file content (PyMuPDF when available, PyPDF2 fallback)"""
         try:
+            if PYMUPDF_AVAILABLE:
+                doc = fitz.open(file_path)
+                try:
+                    page_count = doc.page_count
+                    parts = None if page_count > 1 else \
+                        [page.get_text("text") for page in doc]
+                finally:
+                    doc.close()
+
+                if parts is None:
+                    # PyMuPDF releases the GIL during extraction, so
+                    # multi-page PDFs scale across threads — but a
+                    # fitz.Document is not thread-safe, so each worker
+                    # opens its own handle for its slice of pages
+                    # instead of sharing one document
+                    workers = min(page_count, os.cpu_count() or 1)
+                    per_worker = -(-page_count // workers)  # ceil division
+                    ranges = [(start, min(start + per_worker, page_count))
+                              for start in range(0, page_count, per_worker)]
+
+                    def extract_range(bounds):
+                        start, stop = bounds
+                        with fitz.open(file_path) as worker_doc:
+                            return "\n".join(
+                                worker_doc.load_page(i).get_text("text")
+                                for i in range(start, stop)
+                            )
+
+                    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                        parts = list(pool.map(extract_range, ranges))
+                return "\n".join(parts).strip()
+            
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                content = ""
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    content += page.extract_text() + "\n"
-                
-                return content.strip()
+                parts = [page.extract_text() for page in pdf_reader.pages]
+                return "\n".join(parts).strip()
                 
         except Exception as e:
             self.logger.error(f"Error reading PDF '{file_path}': {e}")
@@ -106,18 +178,14 @@ class DocumentReader:
         """Read DOCX file content"""
         try:
             doc = Document(file_path)
-            content = ""
-            
-            for paragraph in doc.paragraphs:
-                content += paragraph.text + "\n"
-            
+            parts = [paragraph.text for paragraph in doc.paragraphs]
+
             # Also read tables if any
             for table in doc.tables:
                 for row in table.rows:
-                    row_text = "\t".join(cell.text for cell in row.cells)
-                    content += row_text + "\n"
-            
-            return content.strip()
+                    parts.append("\t".join(cell.text for cell in row.cells))
+
+            return "\n".join(parts).strip()
             
         except Exception as e:
             self.logger.error(f"Error reading DOCX '{file_path}': {e}")
@@ -126,15 +194,21 @@ class DocumentReader:
     def _read_text(self, file_path: str) -> Optional[str]:
         """Read plain text file content"""
         try:
-            # Detect encoding
+            # Single read: feed chardet incrementally so it can short-circuit
+            # once confident, and decode the bytes we already hold instead of
+            # re-reading the file with the detected encoding
+            detector = UniversalDetector()
+            raw = bytearray()
             with open(file_path, 'rb') as file:
-                raw_data = file.read()
-                encoding = chardet.detect(raw_data)['encoding']
-            
-            # Read with detected encoding
-            with open(file_path, 'r', encoding=encoding or 'utf-8') as file:
-                return file.read()
-                
+                while chunk := file.read(65536):
+                    raw += chunk
+                    if not detector.done:
+                        detector.feed(chunk)
+            detector.close()
+            encoding = detector.result['encoding']
+
+            return bytes(raw).decode(encoding or 'utf-8', errors='replace')
+
         except Exception as e:
             self.logger.error(f"Error reading text file '{file_path}': {e}")
             return None
@@ -142,18 +216,16 @@ class DocumentReader:
     def _read_rtf(self, file_path: str) -> Optional[str]:
         """Read RTF file content (basic implementation)"""
         try:
-            # For RTF files, we'll read as text and do basic cleanup
+            # For RTF files, we'll read as bytes and do basic cleanup
             # This is a simplified approach - for full RTF support, use striprtf library
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                content = file.read()
-                
-                # Basic RTF cleanup (remove common RTF tags)
-                import re
-                content = re.sub(r'\\[a-z]+\d*\s?', '', content)  # Remove RTF commands
-                content = re.sub(r'[{}]', '', content)  # Remove braces
-                content = re.sub(r'\s+', ' ', content)  # Normalize whitespace
-                
-                return content.strip()
+            with open(file_path, 'rb') as file:
+                raw = file.read()
+
+            # Basic RTF cleanup with the module-level compiled patterns
+            raw = _RTF_MARKUP.sub(b'', raw)  # Remove RTF commands and braces
+            raw = _RTF_WS.sub(b' ', raw)  # Normalize whitespace
+
+            return raw.decode('utf-8', errors='ignore').strip()
                 
         except Exception as e:
             self.logger.error(f"Error reading RTF '{file_path}': {e}")
@@ -219,33 +291,32 @@ class DocumentReader:
             Dict: Search results with occurrences and context
         """
         try:
-            if not case_sensitive:
-                content_search = content.lower()
-                term_search = search_term.lower()
-            else:
-                content_search = content
-                term_search = search_term
-            
+            # One C-level scan instead of repeated str.find calls; IGNORECASE
+            # replaces the full lowercased copy of the content
+            pattern = re.compile(re.escape(search_term),
+                                 0 if case_sensitive else re.IGNORECASE)
+
+            # Collect newline positions in one vectorized pass so each hit's
+            # line number is a binary search instead of an O(N) prefix rescan.
+            # UTF-32 keeps the byte view aligned with str indices.
+            nl_idx = np.flatnonzero(
+                np.frombuffer(content.encode('utf-32-le'), dtype=np.uint32) == 0x0A
+            )
+
             occurrences = []
-            start = 0
-            
-            while True:
-                index = content_search.find(term_search, start)
-                if index == -1:
-                    break
-                
+            for match in pattern.finditer(content):
+                index = match.start()
+
                 # Get context around the found term
                 context_start = max(0, index - 50)
                 context_end = min(len(content), index + len(search_term) + 50)
                 context = content[context_start:context_end]
-                
+
                 occurrences.append({
                     "index": index,
                     "context": context.strip(),
-                    "line_number": content[:index].count('\n') + 1
+                    "line_number": int(np.searchsorted(nl_idx, index)) + 1
                 })
-                
-                start = index + 1
             
             return {
                 "search_term": search_term,
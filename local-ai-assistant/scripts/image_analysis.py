@@ -3,8 +3,11 @@ Image Analysis Module
 Handles image processing and analysis using computer vision
 """
 
+import collections
+import mmap
 import os
 import logging
+import shutil
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -21,24 +24,94 @@ except ImportError:
 
 # Add parent directory to path for importing config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import Config
+from config import get_config
 
 class ImageAnalysis:
+    # Analysis results kept per (path, mtime_ns, size); a changed file gets
+    # a new key, so stale entries simply age out of the LRU
+    _CACHE_SIZE = 128
+
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = logging.getLogger(__name__)
+        self._result_cache = collections.OrderedDict()
+        # Parse the Haar cascade XML once per instance, not per image
+        if OPENCV_AVAILABLE:
+            self._face_cascade = cv2.CascadeClassifier(
+                cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+            )
+        else:
+            self._face_cascade = None
+        # Transparent-API: route filter kernels through OpenCL when a device
+        # is available (UMat falls back to the CPU path otherwise)
+        self._use_opencl = OPENCV_AVAILABLE and cv2.ocl.haveOpenCL()
+        # CUDA build of OpenCV: construct the device-side filters once so
+        # per-image work is upload + kernel + scalar reduction. Standard
+        # opencv-python wheels have no CUDA, so probe defensively.
+        self._cuda_canny = None
+        self._cuda_laplacian = None
+        if OPENCV_AVAILABLE:
+            try:
+                if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                    self._cuda_canny = cv2.cuda.createCannyEdgeDetector(50, 150)
+                    self._cuda_laplacian = cv2.cuda.createLaplacianFilter(
+                        cv2.CV_32FC1, cv2.CV_32FC1, ksize=3
+                    )
+            except (AttributeError, cv2.error):
+                pass
+
+    def _cache_key(self, file_path: str):
+        """Cache key that changes whenever the file content can have changed"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, st.st_mtime_ns, st.st_size)
+
+    def _imread_mmap(self, image_path: str) -> Optional[np.ndarray]:
+        """Decode an image from a memory-mapped file
+
+        cv2.imread copies the whole file into a private buffer before
+        decoding; mapping it lets the decoder read the OS page cache
+        directly, saving one full-file memcpy on large inputs.
+        """
+        try:
+            with open(image_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    buf = np.frombuffer(mm, dtype=np.uint8)
+                    # imdecode copies into a fresh array, but the buf view
+                    # still pins the map — drop it before the with-block
+                    # calls mm.close(), which raises BufferError while any
+                    # exported pointer exists
+                    image = cv2.imdecode(buf, cv2.IMREAD_COLOR)
+                    del buf
+                    return image
+        except (OSError, ValueError, BufferError):
+            # Empty file or mmap failure; fall back to the plain reader
+            return cv2.imread(image_path)
+
+    def _as_umat(self, gray: np.ndarray):
+        """Wrap gray in a UMat for GPU execution when OpenCL is available"""
+        return cv2.UMat(gray) if self._use_opencl else gray
     
-    def analyze_image(self, image_path: str) -> Dict:
+    # All available sub-analyses, in output order
+    _ALL_FEATURES = ("basic", "colors", "edges", "faces", "objects", "quality")
+
+    def analyze_image(self, image_path: str, features: Tuple[str, ...] = _ALL_FEATURES) -> Dict:
         """
         Analyze image and extract various features
-        
+
         Args:
             image_path (str): Path to the image file
-            
+            features (Tuple[str, ...]): Which sub-analyses to run; defaults to
+                all of them. Callers that only need e.g. face detection can
+                pass features=("faces",) and skip the other passes.
+
         Returns:
             Dict: Analysis results including objects, colors, etc.
         """
         try:
+            features = tuple(features)
             # Validate file
             is_valid, message = self.config.validate_file(image_path, "image")
             if not is_valid:
@@ -47,13 +120,22 @@ class ImageAnalysis:
                     "message": message,
                     "analysis": {}
                 }
-            
+
+            # Analysis is deterministic in the file content, so repeat calls
+            # on an unchanged file are served from the cache
+            cache_key = self._cache_key(image_path)
+            if cache_key is not None:
+                cache_key = cache_key + (features,)
+            if cache_key in self._result_cache:
+                self._result_cache.move_to_end(cache_key)
+                return self._result_cache[cache_key]
+
             if not OPENCV_AVAILABLE:
                 # Use PIL-only analysis
                 return self._analyze_with_pil(image_path)
             
-            # Load image with OpenCV
-            image = cv2.imread(image_path)
+            # Load image with OpenCV (decoding straight from the page cache)
+            image = self._imread_mmap(image_path)
             if image is None:
                 return {
                     "success": False,
@@ -61,22 +143,40 @@ class ImageAnalysis:
                     "analysis": {}
                 }
             
-            # Perform various analyses
-            analysis_results = {
-                "basic_info": self._get_basic_info(image_path, image),
-                "color_analysis": self._analyze_colors(image),
-                "edge_detection": self._detect_edges(image),
-                "face_detection": self._detect_faces(image),
-                "object_detection": self._detect_objects(image),
-                "image_quality": self._assess_quality(image)
+            # Convert to grayscale once (only if a requested helper needs it);
+            # every helper below shares it instead of re-running BGR2GRAY
+            gray = None
+            if any(f in features for f in ("colors", "edges", "faces", "objects", "quality")):
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+            # Run only the requested sub-analyses
+            dispatch = {
+                "basic": ("basic_info", lambda: self._get_basic_info(image_path, image)),
+                "colors": ("color_analysis", lambda: self._analyze_colors(image, gray)),
+                "edges": ("edge_detection", lambda: self._detect_edges(gray)),
+                "faces": ("face_detection", lambda: self._detect_faces(gray)),
+                "objects": ("object_detection", lambda: self._detect_objects(gray)),
+                "quality": ("image_quality", lambda: self._assess_quality(gray)),
             }
-            
-            return {
+            analysis_results = {}
+            for feature in self._ALL_FEATURES:
+                if feature in features:
+                    result_key, run = dispatch[feature]
+                    analysis_results[result_key] = run()
+
+            result = {
                 "success": True,
                 "file_path": image_path,
                 "analysis": analysis_results
             }
-            
+
+            if cache_key is not None:
+                self._result_cache[cache_key] = result
+                if len(self._result_cache) > self._CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+            return result
+
         except Exception as e:
             self.logger.error(f"Error analyzing image '{image_path}': {e}")
             return {
@@ -97,9 +197,10 @@ class ImageAnalysis:
                 if mode != 'RGB':
                     img = img.convert('RGB')
                 
-                # Get basic statistics
-                img_array = np.array(img)
-                
+                # Get basic statistics in a single pass over the pixels
+                img_array = np.asarray(img)
+                mean_rgb = img_array.mean(axis=(0, 1))
+
                 analysis_results = {
                     "basic_info": {
                         "dimensions": f"{width}x{height}",
@@ -112,8 +213,8 @@ class ImageAnalysis:
                         "total_pixels": width * height
                     },
                     "color_analysis": {
-                        "mean_color_rgb": [int(np.mean(img_array[:,:,i])) for i in range(3)],
-                        "brightness": round(np.mean(img_array), 2),
+                        "mean_color_rgb": [int(c) for c in mean_rgb],
+                        "brightness": round(float(mean_rgb.mean()), 2),
                         "note": "Limited analysis - OpenCV not available"
                     },
                     "opencv_status": "Not available - install OpenCV for full analysis"
@@ -157,24 +258,22 @@ class ImageAnalysis:
             self.logger.error(f"Error getting basic info: {e}")
             return {}
     
-    def _analyze_colors(self, image: np.ndarray) -> Dict:
+    def _analyze_colors(self, image: np.ndarray, gray: np.ndarray) -> Dict:
         """Analyze color distribution in the image"""
         try:
             # Convert BGR to RGB
             image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            # Calculate color statistics
-            mean_color = np.mean(image_rgb, axis=(0, 1))
-            
+
+            # Mean color via OpenCV's SIMD reduction (returns BGR; flip to RGB)
+            mean_color = cv2.mean(image)[2::-1]
+
             # Get dominant colors using K-means clustering
             dominant_colors = self._get_dominant_colors(image_rgb, k=5)
-            
-            # Calculate brightness
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            brightness = np.mean(gray)
-            
-            # Calculate contrast
-            contrast = np.std(gray)
+
+            # Brightness and contrast in a single fused pass over the shared gray
+            mean_val, stddev_val = cv2.meanStdDev(gray)
+            brightness = float(mean_val[0, 0])
+            contrast = float(stddev_val[0, 0])
             
             return {
                 "mean_color_rgb": [int(c) for c in mean_color],
@@ -189,24 +288,28 @@ class ImageAnalysis:
             return {}
     
     def _get_dominant_colors(self, image: np.ndarray, k: int = 5) -> List[List[int]]:
-        """Get dominant colors using K-means clustering"""
+        """Get dominant colors via a quantized color histogram (top-k bins)"""
         try:
-            # Reshape image to be a list of pixels
-            pixels = image.reshape(-1, 3)
-            
-            # Use K-means clustering
-            from sklearn.cluster import KMeans
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            kmeans.fit(pixels)
-            
-            # Get the colors
-            colors = kmeans.cluster_centers_
-              # Convert to integers and return
-            return [[int(c) for c in color] for color in colors]
-            
-        except ImportError:
-            # Fallback if sklearn is not available
-            return []
+            # Quantize each channel to 6 bits and pack into a single uint32
+            # key per pixel; the k most frequent bins are the dominant colors.
+            # One vectorized pass, no iterative clustering.
+            q = (image >> 2).astype(np.uint32)
+            keys = (q[..., 0] << 12) | (q[..., 1] << 6) | q[..., 2]
+            vals, counts = np.unique(keys.ravel(), return_counts=True)
+
+            if counts.size > k:
+                idx = np.argpartition(-counts, k - 1)[:k]
+            else:
+                idx = np.arange(counts.size)
+            idx = idx[np.argsort(-counts[idx])]
+            top = vals[idx]
+
+            # Unpack the bins back to 8-bit RGB
+            r = ((top >> 12) & 0x3F) << 2
+            g = ((top >> 6) & 0x3F) << 2
+            b = (top & 0x3F) << 2
+            return [[int(cr), int(cg), int(cb)] for cr, cg, cb in zip(r, g, b)]
+
         except Exception as e:
             self.logger.error(f"Error getting dominant colors: {e}")
             return []
@@ -226,19 +329,27 @@ class ImageAnalysis:
         except Exception:
             return "Unknown"
     
-    def _detect_edges(self, image: np.ndarray) -> Dict:
+    def _detect_edges(self, gray: np.ndarray) -> Dict:
         """Detect edges in the image using Canny edge detection"""
         try:
             if not OPENCV_AVAILABLE:
                 return {"error": "OpenCV not available for edge detection"}
-                
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Apply Canny edge detection
-            edges = cv2.Canny(gray, 50, 150)
-            
-            # Count edge pixels
-            edge_pixel_count = np.sum(edges > 0)
+
+            # Apply Canny edge detection. Prefer the CUDA detector (upload
+            # once, reduce on-device, download a scalar), then OpenCL/CPU.
+            edge_pixel_count = None
+            if self._cuda_canny is not None:
+                try:
+                    gpu = cv2.cuda_GpuMat()
+                    gpu.upload(gray)
+                    edges_gpu = self._cuda_canny.detect(gpu)
+                    edge_pixel_count = int(cv2.cuda.countNonZero(edges_gpu))
+                except cv2.error:
+                    edge_pixel_count = None
+            if edge_pixel_count is None:
+                edges = cv2.Canny(self._as_umat(gray), 50, 150)
+                # countNonZero accepts both Mat and UMat
+                edge_pixel_count = cv2.countNonZero(edges)
             total_pixels = gray.shape[0] * gray.shape[1]
             edge_density = edge_pixel_count / total_pixels
             
@@ -253,28 +364,37 @@ class ImageAnalysis:
             self.logger.error(f"Error detecting edges: {e}")
             return {}
     
-    def _detect_faces(self, image: np.ndarray) -> Dict:
+    def _detect_faces(self, gray: np.ndarray) -> Dict:
         """Detect faces in the image using Haar cascades"""
         try:
             if not OPENCV_AVAILABLE:
                 return {"face_count": 0, "faces": [], "error": "OpenCV not available for face detection"}
-                
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Load face cascade classifier
-            face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-            
-            # Detect faces
-            faces = face_cascade.detectMultiScale(gray, 1.1, 4)
-            
+
+            # Cap the detection resolution: the cascade pyramid on a 4K frame
+            # is dominated by the smallest scales, and faces survive a 1024px
+            # downscale. Detected boxes are mapped back to original coordinates.
+            scale = 1.0
+            small = gray
+            if max(gray.shape) > 1024:
+                scale = 1024 / max(gray.shape)
+                small = cv2.resize(gray, None, fx=scale, fy=scale,
+                                   interpolation=cv2.INTER_AREA)
+
+            # Detect faces with the cascade loaded in __init__
+            faces = self._face_cascade.detectMultiScale(
+                small, scaleFactor=1.2, minNeighbors=5, minSize=(30, 30)
+            )
+
+            inv = 1.0 / scale
             face_info = []
             for (x, y, w, h) in faces:
+                x, y, w, h = int(x * inv), int(y * inv), int(w * inv), int(h * inv)
                 face_info.append({
-                    "x": int(x),
-                    "y": int(y),
-                    "width": int(w),
-                    "height": int(h),
-                    "area": int(w * h)
+                    "x": x,
+                    "y": y,
+                    "width": w,
+                    "height": h,
+                    "area": w * h
                 })
             
             return {
@@ -286,32 +406,34 @@ class ImageAnalysis:
             self.logger.error(f"Error detecting faces: {e}")
             return {"face_count": 0, "faces": []}
     
-    def _detect_objects(self, image: np.ndarray) -> Dict:
+    def _detect_objects(self, gray: np.ndarray) -> Dict:
         """Basic object detection using contours"""
         try:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Apply threshold
-            _, thresh = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
+            # Apply threshold (on the GPU when OpenCL is available)
+            _, thresh = cv2.threshold(self._as_umat(gray), 127, 255, cv2.THRESH_BINARY)
             
             # Find contours
             contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
-            # Filter contours by area
+            # Filter contours by area in one vectorized pass, then compute
+            # bounding boxes only for the survivors
             min_area = 1000
+            areas = np.fromiter(
+                (cv2.contourArea(c) for c in contours),
+                dtype=np.float32, count=len(contours)
+            )
+            keep = np.flatnonzero(areas > min_area)
+
             objects = []
-            
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if area > min_area:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    objects.append({
-                        "x": int(x),
-                        "y": int(y),
-                        "width": int(w),
-                        "height": int(h),
-                        "area": int(area)
-                    })
+            for i in keep:
+                x, y, w, h = cv2.boundingRect(contours[i])
+                objects.append({
+                    "x": int(x),
+                    "y": int(y),
+                    "width": int(w),
+                    "height": int(h),
+                    "area": int(areas[i])
+                })
             
             return {
                 "object_count": len(objects),
@@ -323,14 +445,29 @@ class ImageAnalysis:
             self.logger.error(f"Error detecting objects: {e}")
             return {"object_count": 0, "objects": []}
     
-    def _assess_quality(self, image: np.ndarray) -> Dict:
+    def _assess_quality(self, gray: np.ndarray) -> Dict:
         """Assess image quality"""
         try:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Calculate Laplacian variance (blur detection)
-            laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
-            
+            # Calculate Laplacian variance (blur detection). Prefer the CUDA
+            # filter built in __init__ with on-device sum reductions; fall
+            # back to the CV_16S Laplacian + meanStdDev path (UMat-friendly).
+            laplacian_var = None
+            if self._cuda_laplacian is not None:
+                try:
+                    gpu = cv2.cuda_GpuMat()
+                    gpu.upload(gray)
+                    gpu32 = gpu.convertTo(cv2.CV_32F)
+                    lap_gpu = self._cuda_laplacian.apply(gpu32)
+                    n = gray.shape[0] * gray.shape[1]
+                    mean = cv2.cuda.sum(lap_gpu)[0] / n
+                    laplacian_var = cv2.cuda.sqrSum(lap_gpu)[0] / n - mean * mean
+                except cv2.error:
+                    laplacian_var = None
+            if laplacian_var is None:
+                lap = cv2.Laplacian(self._as_umat(gray), cv2.CV_16S, ksize=3)
+                _, stddev = cv2.meanStdDev(lap)
+                laplacian_var = float(stddev[0, 0]) ** 2
+
             # Calculate noise level (using standard deviation)
             noise_level = np.std(gray)
             
@@ -377,16 +514,30 @@ class ImageAnalysis:
     def convert_format(self, input_path: str, output_path: str) -> Dict:
         """Convert image to different format"""
         try:
-            image = Image.open(input_path)
-            image.save(output_path)
-            
+            input_format = os.path.splitext(input_path)[1]
+            output_format = os.path.splitext(output_path)[1]
+
+            if input_format.lower() == output_format.lower():
+                # Same container: a byte copy is lossless and skips the full
+                # decode/re-encode round trip entirely
+                shutil.copyfile(input_path, output_path)
+            elif output_format.lower() == '.webp' and OPENCV_AVAILABLE:
+                # libwebp via OpenCV encodes noticeably faster than PIL here
+                image = cv2.imread(input_path)
+                if image is None:
+                    return {"success": False, "message": "Could not load image"}
+                cv2.imwrite(output_path, image, [cv2.IMWRITE_WEBP_QUALITY, 90])
+            else:
+                image = Image.open(input_path)
+                image.save(output_path)
+
             return {
                 "success": True,
-                "input_format": os.path.splitext(input_path)[1],
-                "output_format": os.path.splitext(output_path)[1],
+                "input_format": input_format,
+                "output_format": output_format,
                 "output_path": output_path
             }
-            
+
         except Exception as e:
             self.logger.error(f"Error converting image format: {e}")
             return {"success": False, "message": str(e)}
\ No newline at end of file
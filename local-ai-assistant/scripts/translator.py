@@ -3,50 +3,191 @@ Translation Module
 Handles text translation between different languages
 """
 
+import collections
+import hashlib
 import logging
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
+import requests
 from deep_translator import GoogleTranslator as DeepGoogleTranslator
 from deep_translator import single_detection
 import sys
 import os
 
-# Add parent directory to path for importing config
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import Config
+# Try to use a local n-gram detector so language detection doesn't cost
+# an HTTP round trip; fall back to the remote API if not installed
+try:
+    from langdetect import DetectorFactory, detect_langs
+    DetectorFactory.seed = 0  # deterministic results
+    LANGDETECT_AVAILABLE = True
+except ImportError:
+    LANGDETECT_AVAILABLE = False
+
+# Make the project root importable for config; the membership check keeps
+# repeated imports from growing sys.path (which slows every later import)
+_PARENT = os.path.dirname(os.path.dirname(__file__))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
+from config import get_config
+
+# Zero-width split points after sentence-ending punctuation; compiled
+# once at import. The lookbehind keeps the punctuation and its trailing
+# space inside the preceding piece, so rejoining pieces is lossless.
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?] )')
+
+# Language tables built once at import; instances share them instead of
+# rebuilding the dicts per construction
+_LANGUAGE_CODES = {
+    'turkish': 'tr', 'türkçe': 'tr', 'tr': 'tr',
+    'english': 'en', 'ingilizce': 'en', 'en': 'en',
+    'german': 'de', 'almanca': 'de', 'de': 'de',
+    'french': 'fr', 'fransızca': 'fr', 'fr': 'fr',
+    'spanish': 'es', 'ispanyolca': 'es', 'es': 'es',
+    'italian': 'it', 'italyanca': 'it', 'it': 'it',
+    'russian': 'ru', 'rusça': 'ru', 'ru': 'ru',
+    'chinese': 'zh', 'çince': 'zh', 'zh': 'zh',
+    'japanese': 'ja', 'japonca': 'ja', 'ja': 'ja',
+    'korean': 'ko', 'korece': 'ko', 'ko': 'ko',
+    'arabic': 'ar', 'arapça': 'ar', 'ar': 'ar',
+    'portuguese': 'pt', 'portekizce': 'pt', 'pt': 'pt',
+    'dutch': 'nl', 'hollandaca': 'nl', 'nl': 'nl',
+    'swedish': 'sv', 'isveççe': 'sv', 'sv': 'sv',
+    'danish': 'da', 'danca': 'da', 'da': 'da',
+    'norwegian': 'no', 'norveççe': 'no', 'no': 'no',
+    'polish': 'pl', 'lehçe': 'pl', 'pl': 'pl',
+    'czech': 'cs', 'çekçe': 'cs', 'cs': 'cs',
+    'hungarian': 'hu', 'macarca': 'hu', 'hu': 'hu',
+    'greek': 'el', 'yunanca': 'el', 'el': 'el',
+    'hebrew': 'he', 'ibrance': 'he', 'he': 'he',
+    'hindi': 'hi', 'hintçe': 'hi', 'hi': 'hi',
+    'thai': 'th', 'tayca': 'th', 'th': 'th',
+    'vietnamese': 'vi', 'vietnamca': 'vi', 'vi': 'vi'
+}
+
+# Valid two-letter codes, for the O(1) fallback check in normalization
+_TWO_LETTER = frozenset(_LANGUAGE_CODES.values())
+
+_LANGUAGE_NAMES = {
+    'tr': 'Turkish', 'en': 'English', 'de': 'German', 'fr': 'French',
+    'es': 'Spanish', 'it': 'Italian', 'ru': 'Russian', 'zh': 'Chinese',
+    'ja': 'Japanese', 'ko': 'Korean', 'ar': 'Arabic', 'pt': 'Portuguese',
+    'nl': 'Dutch', 'sv': 'Swedish', 'da': 'Danish', 'no': 'Norwegian',
+    'pl': 'Polish', 'cs': 'Czech', 'hu': 'Hungarian', 'el': 'Greek',
+    'he': 'Hebrew', 'hi': 'Hindi', 'th': 'Thai', 'vi': 'Vietnamese'
+}
 
 class Translator:
+    # Completed translations kept per (source, target, text); duplicate
+    # paragraphs and repeated UI strings collapse to one API call
+    _CACHE_SIZE = 10000
+
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = logging.getLogger(__name__)
-        
-        # Language codes mapping
-        self.language_codes = {
-            'turkish': 'tr', 'türkçe': 'tr', 'tr': 'tr',
-            'english': 'en', 'ingilizce': 'en', 'en': 'en',
-            'german': 'de', 'almanca': 'de', 'de': 'de',
-            'french': 'fr', 'fransızca': 'fr', 'fr': 'fr',
-            'spanish': 'es', 'ispanyolca': 'es', 'es': 'es',
-            'italian': 'it', 'italyanca': 'it', 'it': 'it',
-            'russian': 'ru', 'rusça': 'ru', 'ru': 'ru',
-            'chinese': 'zh', 'çince': 'zh', 'zh': 'zh',
-            'japanese': 'ja', 'japonca': 'ja', 'ja': 'ja',
-            'korean': 'ko', 'korece': 'ko', 'ko': 'ko',
-            'arabic': 'ar', 'arapça': 'ar', 'ar': 'ar',
-            'portuguese': 'pt', 'portekizce': 'pt', 'pt': 'pt',
-            'dutch': 'nl', 'hollandaca': 'nl', 'nl': 'nl',
-            'swedish': 'sv', 'isveççe': 'sv', 'sv': 'sv',
-            'danish': 'da', 'danca': 'da', 'da': 'da',
-            'norwegian': 'no', 'norveççe': 'no', 'no': 'no',
-            'polish': 'pl', 'lehçe': 'pl', 'pl': 'pl',
-            'czech': 'cs', 'çekçe': 'cs', 'cs': 'cs',
-            'hungarian': 'hu', 'macarca': 'hu', 'hu': 'hu',
-            'greek': 'el', 'yunanca': 'el', 'el': 'el',
-            'hebrew': 'he', 'ibrance': 'he', 'he': 'he',
-            'hindi': 'hi', 'hintçe': 'hi', 'hi': 'hi',
-            'thai': 'th', 'tayca': 'th', 'th': 'th',
-            'vietnamese': 'vi', 'vietnamca': 'vi', 'vi': 'vi'
-        }
-    
+
+        # Language codes mapping (shared module-level table)
+        self.language_codes = _LANGUAGE_CODES
+
+        self._cache = collections.OrderedDict()
+        # Detected languages keyed by a hash of the text prefix, so the
+        # remote detection API is hit at most once per distinct text
+        self._lang_cache = {}
+        # One translator instance per (source, target) pair; reusing them
+        # keeps the underlying HTTP session (and its keep-alive connection)
+        # alive across calls instead of re-handshaking every time
+        self._translators = {}
+
+        # Disk-backed translation cache: the in-memory LRU dies with the
+        # process, so completed translations are also persisted to SQLite
+        # under DATA_DIR and re-runs over the same content skip the API
+        self._db_lock = threading.Lock()
+        try:
+            self._db = sqlite3.connect(
+                os.path.join(self.config.DATA_DIR, 'translation_cache.sqlite'),
+                isolation_level=None, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(k TEXT PRIMARY KEY, v TEXT, src TEXT)"
+            )
+        except sqlite3.Error:
+            self._db = None
+
+        # Pay the cold-start cost (DNS, TLS, endpoint warmup) off the
+        # critical path so the first user-facing translate() is fast;
+        # the config flag lets tests run without network activity
+        if self.config.TRANSLATOR_WARMUP:
+            threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Issue a throwaway translation to prime the connection pool"""
+        try:
+            self._get_translator('en', 'tr').translate('.')
+        except Exception:
+            pass
+
+    @staticmethod
+    def _disk_key(source_lang: str, target_lang: str, text: str) -> str:
+        """Stable cache key; the text is hashed so keys stay small"""
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        return f"{source_lang}|{target_lang}|{digest}"
+
+    def _disk_get(self, key: str):
+        """Look up a persisted translation; returns (text, source) or None"""
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                return self._db.execute(
+                    "SELECT v, src FROM translations WHERE k=?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+    def _disk_put(self, key: str, translated_text: str, source_lang: str):
+        """Persist a completed translation (best effort)"""
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?, ?)",
+                    (key, translated_text, source_lang)
+                )
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _retry(fn, tries: int = 2, base: float = 0.2):
+        """Call fn, retrying transient transport errors with backoff
+
+        Only network-level failures are retried; anything else propagates
+        immediately. Avoiding a false fallback here matters: misdetecting
+        the source as English forces a second, wrong-source translation.
+        """
+        for attempt in range(tries):
+            try:
+                return fn()
+            except (requests.RequestException, TimeoutError):
+                if attempt == tries - 1:
+                    raise
+                time.sleep(base * 2 ** attempt)
+
+    def _get_translator(self, source_lang: str, target_lang: str) -> DeepGoogleTranslator:
+        """Return the pooled translator for a language pair, creating it once"""
+        key = (source_lang, target_lang)
+        translator = self._translators.get(key)
+        if translator is None:
+            translator = DeepGoogleTranslator(source=source_lang, target=target_lang)
+            self._translators[key] = translator
+        return translator
+
     def translate(self, text: str, target_language: str, source_language: str = "auto") -> Dict:
         """
         Translate text to target language
@@ -85,7 +226,7 @@ class Translator:
                 result = self._translate_with_deep_translator(text, target_lang, source_lang)
                 return result
             except Exception as e:
-                self.logger.error(f"Translation failed: {e}")
+                self.logger.error("Translation failed: %s", e)
                 return {
                     "success": False,
                     "message": f"Translation service failed: {str(e)}",
@@ -94,7 +235,7 @@ class Translator:
                 }
                 
         except Exception as e:
-            self.logger.error(f"Error in translation: {e}")
+            self.logger.error("Error in translation: %s", e)
             return {
                 "success": False,
                 "message": f"Translation error: {str(e)}",
@@ -106,25 +247,82 @@ class Translator:
         """Normalize language name/code to standard language code"""
         if not language:
             return None
-        
-        language_lower = language.lower().strip()
-        return self.language_codes.get(language_lower, language_lower if len(language_lower) == 2 else None)
+
+        # Fast path: input is already a canonical key ("en", "turkish"),
+        # which covers most calls with a single dict probe and no allocation
+        code = _LANGUAGE_CODES.get(language)
+        if code is not None:
+            return code
+
+        # casefold (not lower) matches the Turkish names in the table correctly
+        key = language.strip().casefold()
+        return _LANGUAGE_CODES.get(key) or (key if key in _TWO_LETTER else None)
     
     def _translate_with_deep_translator(self, text: str, target_lang: str, source_lang: str) -> Dict:
         """Translate using deep-translator library"""
         try:
+            # Serve repeats from the memo before any network work (an "auto"
+            # hit also skips the detection call)
+            cache_key = (source_lang, target_lang, text)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                translated_text, resolved_source = cached
+                return {
+                    "success": True,
+                    "original_text": text,
+                    "translated_text": translated_text,
+                    "source_language": resolved_source,
+                    "target_language": target_lang,
+                    "confidence": None,
+                    "service": "deep-translator"
+                }
+
+            # Then the disk cache, which survives process restarts
+            disk_key = self._disk_key(source_lang, target_lang, text)
+            row = self._disk_get(disk_key)
+            if row is not None:
+                translated_text, resolved_source = row
+                self._cache[cache_key] = (translated_text, resolved_source)
+                if len(self._cache) > self._CACHE_SIZE:
+                    self._cache.popitem(last=False)
+                return {
+                    "success": True,
+                    "original_text": text,
+                    "translated_text": translated_text,
+                    "source_language": resolved_source,
+                    "target_language": target_lang,
+                    "confidence": None,
+                    "service": "deep-translator"
+                }
+
             if source_lang == "auto":
-                # Try to detect language
-                try:
-                    detected_lang = single_detection(text, api_key=None)
-                    source_lang = detected_lang if detected_lang else "en"
-                except:
-                    source_lang = "en"  # Default fallback
-            
-            # Create translator instance
-            translator = DeepGoogleTranslator(source=source_lang, target=target_lang)
-            translated_text = translator.translate(text)
-            
+                source_lang = self._detect_source(text)
+
+            # Nothing to translate when the pair resolves to the same
+            # language (common when auto-detect returns the target)
+            if source_lang == target_lang:
+                return {
+                    "success": True,
+                    "original_text": text,
+                    "translated_text": text,
+                    "source_language": source_lang,
+                    "target_language": target_lang,
+                    "confidence": 1.0,
+                    "service": "identity"
+                }
+
+            # Reuse the pooled translator for this language pair; retry once
+            # on transient transport errors before giving up
+            translator = self._get_translator(source_lang, target_lang)
+            translated_text = self._retry(lambda: translator.translate(text))
+
+            # Only successful translations are cached, under the caller's key
+            self._cache[cache_key] = (translated_text, source_lang)
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+            self._disk_put(disk_key, translated_text, source_lang)
+
             return {
                 "success": True,
                 "original_text": text,
@@ -137,7 +335,277 @@ class Translator:
             
         except Exception as e:
             raise Exception(f"Deep translator error: {str(e)}")
-    
+
+    def _detect_source(self, text: str) -> str:
+        """Resolve an "auto" source to a concrete language code cheaply
+
+        Short plain-ASCII snippets default to English and unambiguous
+        scripts map straight to a code, so the remote detection API is
+        only consulted for genuinely ambiguous text — and then at most
+        once per distinct text thanks to the cache.
+        """
+        stripped = text.strip()
+
+        if stripped.isascii() and len(stripped) < 32:
+            return "en"
+
+        hint = self._script_hint(stripped)
+        if hint:
+            return hint
+
+        key = hash(stripped[:256])
+        cached = self._lang_cache.get(key)
+        if cached:
+            return cached
+
+        detected_lang = self._detect_local(stripped)
+        if detected_lang is None:
+            try:
+                detected_lang = self._retry(
+                    lambda: single_detection(text, api_key=None)
+                ) or "en"
+            except (requests.RequestException, TimeoutError, ValueError, KeyError):
+                detected_lang = "en"  # Default fallback
+
+        self._lang_cache[key] = detected_lang
+        return detected_lang
+
+    @staticmethod
+    def _detect_local(text: str) -> Optional[str]:
+        """Detect language with the local n-gram detector, if installed"""
+        if not LANGDETECT_AVAILABLE:
+            return None
+        try:
+            # langdetect uses regional codes like zh-cn; keep the base code
+            return detect_langs(text)[0].lang.split('-')[0]
+        except Exception:
+            return None
+
+    @staticmethod
+    def _script_hint(text: str) -> Optional[str]:
+        """Map text in an unambiguous script to a language code locally"""
+        saw_cjk = False
+        for ch in text[:64]:
+            cp = ord(ch)
+            if 0x3040 <= cp <= 0x30FF:  # Hiragana/Katakana
+                return "ja"
+            if 0xAC00 <= cp <= 0xD7AF:  # Hangul
+                return "ko"
+            if 0x4E00 <= cp <= 0x9FFF:  # CJK ideographs; kana may still follow
+                saw_cjk = True
+            elif 0x0400 <= cp <= 0x04FF:  # Cyrillic
+                return "ru"
+            elif 0x0600 <= cp <= 0x06FF:  # Arabic
+                return "ar"
+            elif 0x0590 <= cp <= 0x05FF:  # Hebrew
+                return "he"
+            elif 0x0E00 <= cp <= 0x0E7F:  # Thai
+                return "th"
+            elif 0x0900 <= cp <= 0x097F:  # Devanagari
+                return "hi"
+        return "zh" if saw_cjk else None
+
+    def translate_batch(self, texts: List[str], target_language: str, source_language: str = "auto") -> List[Dict]:
+        """
+        Translate several texts to the target language in one batch
+
+        Unique texts are fanned out over a bounded thread pool (cap set by
+        the TRANSLATE_CONCURRENCY config value), so a batch costs roughly
+        one round trip instead of N sequential ones while keeping the
+        request rate on the upstream service predictable.
+
+        Args:
+            texts (List[str]): Texts to translate
+            target_language (str): Target language code or name
+            source_language (str): Source language code (auto-detect if "auto")
+
+        Returns:
+            List[Dict]: One translation result dict per text, in input order
+        """
+        if not texts:
+            return []
+
+        try:
+            # Only validate here: the per-item translate() calls normalize
+            # the raw language arguments themselves, so this just rejects
+            # an unsupported target once instead of N times
+            if not self._normalize_language_code(target_language):
+                return [{
+                    "success": False,
+                    "message": f"Unsupported target language: {target_language}",
+                    "original_text": text,
+                    "translated_text": ""
+                } for text in texts]
+
+            # Deduplicate before dispatching so repeated inputs are
+            # translated once and fanned back out afterwards; each unique
+            # text goes through translate(), so the memo and pooled
+            # translator instances are shared with the single-item path
+            unique_texts = list(dict.fromkeys(texts))
+
+            if len(unique_texts) == 1:
+                results = [self.translate(unique_texts[0], target_language, source_language)]
+            else:
+                max_workers = min(len(unique_texts), self.config.TRANSLATE_CONCURRENCY or 8)
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    results = list(pool.map(
+                        lambda t: self.translate(t, target_language, source_language),
+                        unique_texts
+                    ))
+
+            by_text = dict(zip(unique_texts, results))
+            return [by_text[text] for text in texts]
+
+        except Exception as e:
+            self.logger.error("Error in batch translation: %s", e)
+            return [{
+                "success": False,
+                "message": f"Batch translation error: {str(e)}",
+                "original_text": text,
+                "translated_text": ""
+            } for text in texts]
+
+    def _chunk_text(self, content: str, max_chars: int = 4500) -> List[str]:
+        """Split text into chunks below the translate API's size limit
+
+        Prefers paragraph boundaries, falls back to sentence boundaries for
+        paragraphs that alone exceed the limit, and packs pieces greedily so
+        the resulting batch stays as small as possible. Sentence pieces keep
+        their trailing separators, so packing them back together reproduces
+        the original text; a lone sentence over the limit is sliced hard so
+        no chunk can exceed it.
+        """
+        if len(content) <= max_chars:
+            return [content]
+
+        # (separator, text) pairs: the separator is what goes in front of
+        # the piece when it joins an existing chunk — "\n\n" for a new
+        # paragraph, "" for sentence pieces that already end with ". "
+        pieces = []
+        for paragraph in content.split("\n\n"):
+            if len(paragraph) <= max_chars:
+                pieces.append(("\n\n", paragraph))
+            else:
+                separator = "\n\n"
+                for sentence in _SENTENCE_BOUNDARY.split(paragraph):
+                    for start in range(0, len(sentence), max_chars):
+                        pieces.append((separator, sentence[start:start + max_chars]))
+                        separator = ""
+
+        chunks = []
+        current = ""
+        for separator, piece in pieces:
+            if not current:
+                current = piece
+            elif len(current) + len(separator) + len(piece) <= max_chars:
+                current = f"{current}{separator}{piece}"
+            else:
+                chunks.append(current)
+                current = piece
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _iter_file_chunks(self, f, max_chars: int = 4500):
+        """Yield translation-sized chunks from a text stream lazily
+
+        Reads the file in blocks and cuts on the same paragraph/sentence
+        boundaries as _chunk_text, carrying the trailing partial chunk
+        into the next block, so memory stays bounded by the block size
+        instead of the file size.
+        """
+        pending = ""
+        while True:
+            block = f.read(65536)
+            if not block:
+                break
+            chunks = self._chunk_text(pending + block, max_chars)
+            pending = chunks.pop() if chunks else ""
+            yield from chunks
+        if pending:
+            yield pending
+
+    def translate_file(self, file_path: str, output_path: str, target_language: str,
+                       source_language: str = "auto", max_chars: int = 4500) -> Dict:
+        """
+        Translate a text file and write the result to output_path
+
+        The file is streamed: chunks under the API size limit (Google
+        rejects or truncates ~5000+ character requests) are read lazily,
+        translated in batches of 10, and written out as they complete, so
+        memory use is constant regardless of file size.
+
+        Args:
+            file_path (str): Path to the input text file
+            output_path (str): Where to write the translated text
+            target_language (str): Target language code or name
+            source_language (str): Source language code (auto-detect if "auto")
+            max_chars (int): Maximum characters per translated chunk
+
+        Returns:
+            Dict: File translation result with metadata
+        """
+        try:
+            original_length = 0
+            translated_length = 0
+            chunk_count = 0
+            wrote_any = False
+            batch: List[str] = []
+
+            # utf-8-sig strips a BOM that would otherwise be sent to the API
+            # as text; the 1 MiB buffers cut read/write syscalls on big files
+            with open(file_path, 'r', encoding='utf-8-sig', buffering=1 << 20) as src, \
+                 open(output_path, 'w', encoding='utf-8', buffering=1 << 20, newline='') as out:
+
+                def _flush():
+                    nonlocal translated_length, wrote_any
+                    results = self.translate_batch(batch, target_language, source_language)
+                    for result in results:
+                        if not result.get("success"):
+                            raise RuntimeError(result.get("message", "Translation failed"))
+                        if wrote_any:
+                            out.write("\n\n")
+                            translated_length += 2
+                        out.write(result["translated_text"])
+                        translated_length += len(result["translated_text"])
+                        wrote_any = True
+                    batch.clear()
+
+                for chunk in self._iter_file_chunks(src, max_chars):
+                    if not chunk.strip():
+                        continue
+                    original_length += len(chunk)
+                    chunk_count += 1
+                    batch.append(chunk)
+                    if len(batch) >= 10:
+                        _flush()
+                if batch:
+                    _flush()
+
+            if chunk_count == 0:
+                return {
+                    "success": False,
+                    "message": "File is empty",
+                    "output_path": ""
+                }
+
+            return {
+                "success": True,
+                "file_path": file_path,
+                "output_path": output_path,
+                "chunk_count": chunk_count,
+                "original_length": original_length,
+                "translated_length": translated_length
+            }
+
+        except Exception as e:
+            self.logger.error("Error translating file '%s': %s", file_path, e)
+            return {
+                "success": False,
+                "message": f"File translation error: {str(e)}",
+                "output_path": ""
+            }
+
     def detect_language(self, text: str) -> Dict:
         """
         Detect the language of given text
@@ -157,8 +625,41 @@ class Translator:
                     "confidence": 0
                 }
             
+            stripped = text.strip()
+            has_alpha = any(c.isalpha() for c in stripped)
+
+            if not has_alpha:
+                # Digits/punctuation only — there is no language to detect
+                return {
+                    "success": True,
+                    "text": text,
+                    "detected_language": "und",
+                    "language_name": "Unknown",
+                    "confidence": 0
+                }
+
+            if stripped.isascii() and len(stripped) < 20:
+                # Short plain-ASCII snippets are overwhelmingly English and
+                # too short for the remote detector to do better anyway
+                return {
+                    "success": True,
+                    "text": text,
+                    "detected_language": "en",
+                    "language_name": "English",
+                    "confidence": 0.5
+                }
+
+            key = hash(stripped[:256])
             try:
-                detected_lang = single_detection(text, api_key=None)
+                detected_lang = self._lang_cache.get(key)
+                if detected_lang is None:
+                    detected_lang = self._detect_local(stripped)
+                if detected_lang is None:
+                    detected_lang = self._retry(
+                        lambda: single_detection(text, api_key=None)
+                    )
+                if detected_lang:
+                    self._lang_cache[key] = detected_lang
                 return {
                     "success": True,
                     "text": text,
@@ -166,7 +667,7 @@ class Translator:
                     "language_name": self._get_language_name(detected_lang),
                     "confidence": 0.8  # Default confidence for deep-translator
                 }
-            except:
+            except (requests.RequestException, TimeoutError, ValueError, KeyError):
                 return {
                     "success": False,
                     "message": "Could not detect language",
@@ -175,7 +676,7 @@ class Translator:
                 }
             
         except Exception as e:
-            self.logger.error(f"Error detecting language: {e}")
+            self.logger.error("Error detecting language: %s", e)
             return {
                 "success": False,
                 "message": f"Language detection error: {str(e)}",
@@ -185,15 +686,7 @@ class Translator:
     
     def _get_language_name(self, language_code: str) -> str:
         """Get language name from language code"""
-        language_names = {
-            'tr': 'Turkish', 'en': 'English', 'de': 'German', 'fr': 'French',
-            'es': 'Spanish', 'it': 'Italian', 'ru': 'Russian', 'zh': 'Chinese',
-            'ja': 'Japanese', 'ko': 'Korean', 'ar': 'Arabic', 'pt': 'Portuguese',
-            'nl': 'Dutch', 'sv': 'Swedish', 'da': 'Danish', 'no': 'Norwegian',
-            'pl': 'Polish', 'cs': 'Czech', 'hu': 'Hungarian', 'el': 'Greek',
-            'he': 'Hebrew', 'hi': 'Hindi', 'th': 'Thai', 'vi': 'Vietnamese'
-        }
-        return language_names.get(language_code, language_code.upper())
+        return _LANGUAGE_NAMES.get(language_code, language_code.upper())
     
     def get_supported_languages(self) -> Dict:
         """Get list of supported languages"""
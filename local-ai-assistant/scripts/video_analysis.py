@@ -4,12 +4,19 @@ Handles video processing and analysis
 """
 
 import os
+import json
 import logging
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import matplotlib.pyplot as plt
 import sys
 
+# Located once at import; audio probing falls back to MoviePy without it
+FFPROBE_PATH = shutil.which("ffprobe")
+
 # Try to import MoviePy, fallback if not available
 try:
     from moviepy.editor import VideoFileClip
@@ -28,11 +35,11 @@ except ImportError:
 
 # Add parent directory to path for importing config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import Config
+from config import get_config
 
 class VideoAnalysis:
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = logging.getLogger(__name__)
     
     def analyze_video(self, video_path: str) -> Dict:
@@ -67,7 +74,7 @@ class VideoAnalysis:
                 return self._analyze_with_moviepy(video_path)
             
             # Open video with OpenCV
-            cap = cv2.VideoCapture(video_path)
+            cap = self._open_capture(video_path)
             if not cap.isOpened():
                 return {
                     "success": False,
@@ -75,9 +82,15 @@ class VideoAnalysis:
                     "analysis": {}
                 }
             
-            # Perform various analyses
+            # Perform various analyses; the frame, motion and scene
+            # statistics come out of one fused decode pass
+            basic_info = self._get_basic_info(video_path, cap)
+            frame_analysis, motion_analysis, scene_analysis = self._single_pass_analyze(cap)
             analysis_results = {
-                "basic_info": self._get_basic_info(video_path, cap),
+                "basic_info": basic_info,
+                "frame_analysis": frame_analysis,
+                "motion_analysis": motion_analysis,
+                "scene_analysis": scene_analysis,
                 "audio_analysis": self._analyze_audio(video_path)
             }
             
@@ -139,15 +152,31 @@ class VideoAnalysis:
                 "analysis": {}
             }
     
-    def _get_basic_info(self, video_path: str, cap) -> Dict:
-        """Get basic video information"""
+    def _get_basic_info(self, video_path: str, cap=None) -> Dict:
+        """Get basic video information
+
+        With cap=None the metadata comes from a single ffprobe container
+        probe, so metadata-only callers never pay for opening a decoder;
+        an already-open capture is reused when the caller has one.
+        """
         try:
-            # Get video properties
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            
+            if cap is None:
+                probed = self._probe_video_ffprobe(video_path)
+                if probed is not None:
+                    frame_count, fps, width, height = probed
+                else:
+                    cap = self._open_capture(video_path)
+                    try:
+                        return self._get_basic_info(video_path, cap)
+                    finally:
+                        cap.release()
+            else:
+                # Get video properties
+                frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                fps = cap.get(cv2.CAP_PROP_FPS)
+                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
             # Calculate duration
             duration_seconds = frame_count / fps if fps > 0 else 0
             
@@ -172,6 +201,319 @@ class VideoAnalysis:
             self.logger.error(f"Error getting basic info: {e}")
             return {}
     
+    def _probe_video_ffprobe(self, video_path: str) -> Optional[Tuple[int, float, int, int]]:
+        """(frame_count, fps, width, height) from one ffprobe call, or None"""
+        if FFPROBE_PATH is None:
+            return None
+        try:
+            result = subprocess.run(
+                [FFPROBE_PATH, "-v", "quiet", "-print_format", "json",
+                 "-show_format", "-show_streams", video_path],
+                capture_output=True, timeout=30
+            )
+            if result.returncode != 0:
+                return None
+            data = json.loads(result.stdout)
+        except (OSError, subprocess.TimeoutExpired, ValueError) as e:
+            self.logger.error(f"ffprobe failed for '{video_path}': {e}")
+            return None
+
+        stream = next(
+            (s for s in data.get("streams", []) if s.get("codec_type") == "video"),
+            None
+        )
+        if stream is None:
+            return None
+
+        num, _, den = (stream.get("avg_frame_rate") or "0/1").partition("/")
+        try:
+            fps = float(num) / float(den or 1) if float(den or 1) else 0.0
+        except ValueError:
+            fps = 0.0
+
+        frame_count = int(stream.get("nb_frames") or 0)
+        if frame_count == 0 and fps > 0:
+            duration = float(data.get("format", {}).get("duration", 0) or 0)
+            frame_count = int(duration * fps)
+
+        return frame_count, fps, int(stream.get("width") or 0), int(stream.get("height") or 0)
+
+    @staticmethod
+    def _open_capture(video_path: str):
+        """Open a capture, requesting hardware-accelerated decode if available
+
+        VIDEO_ACCELERATION_ANY lets FFmpeg pick whatever decoder the host
+        offers (NVDEC, VAAPI, ...) and silently falls back to software, so
+        the worst case is the same CPU decode as a plain VideoCapture.
+        """
+        cap = None
+        if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            try:
+                cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [
+                    cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY
+                ])
+                if not cap.isOpened():
+                    cap.release()
+                    cap = None
+            except cv2.error:
+                cap = None
+        if cap is None:
+            cap = cv2.VideoCapture(video_path)
+        return cap
+
+    def _single_pass_analyze(self, cap, max_samples: int = 50,
+                             scene_threshold: float = 0.3) -> Tuple[Dict, Dict, Dict]:
+        """Compute frame, motion and scene statistics in one decode pass
+
+        Decoding dominates the cost of analyze_video, and the frame,
+        motion and scene analyses each used to re-decode the file from
+        frame 0 — three full passes. This fuses them into one sequential
+        traversal: every frame feeds the hue-histogram scene detector,
+        and the sampled frames additionally feed brightness/contrast and
+        the downscaled motion diff.
+
+        Returns (frame_analysis, motion_analysis, scene_analysis).
+        """
+        try:
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            if frame_count <= 0:
+                return {}, {}, {}
+
+            sample_interval = max(1, frame_count // max_samples)
+            n_samples = frame_count // sample_interval + 1
+            brightness = np.empty(n_samples, dtype=np.float32)
+            contrast = np.empty_like(brightness)
+            motion = np.empty(n_samples, dtype=np.float32)
+            sampled = 0
+            pairs = 0
+            prev_small = None
+            prev_hist = None
+            scene_changes = []
+
+            for idx in range(frame_count):
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                # Scene detection sees every frame: a 16-bin hue
+                # histogram at quarter resolution, compared with
+                # Bhattacharyya distance (hue is exposure-invariant,
+                # so brightness flicker does not fire it)
+                h, w = frame.shape[:2]
+                small_bgr = cv2.resize(frame, (max(1, w // 4), max(1, h // 4)),
+                                       interpolation=cv2.INTER_AREA)
+                hsv = cv2.cvtColor(small_bgr, cv2.COLOR_BGR2HSV)
+                hist = cv2.calcHist([hsv], [0], None, [16], [0, 180])
+                cv2.normalize(hist, hist)
+                if prev_hist is not None:
+                    score = cv2.compareHist(prev_hist, hist, cv2.HISTCMP_BHATTACHARYYA)
+                    if score > scene_threshold:
+                        scene_changes.append({
+                            "frame": idx,
+                            "timestamp": round(idx / fps, 2) if fps > 0 else 0,
+                            "change_score": round(score, 3)
+                        })
+                prev_hist = hist
+
+                # Brightness/contrast and motion only at sample points
+                if idx % sample_interval == 0:
+                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                    mean_val, std_val = cv2.meanStdDev(gray)
+                    brightness[sampled] = mean_val[0, 0]
+                    contrast[sampled] = std_val[0, 0]
+                    sampled += 1
+
+                    small_gray = cv2.resize(gray, (320, 180),
+                                            interpolation=cv2.INTER_AREA)
+                    if prev_small is not None:
+                        motion[pairs] = cv2.mean(cv2.absdiff(prev_small, small_gray))[0]
+                        pairs += 1
+                    prev_small = small_gray
+
+            frame_analysis = {}
+            if sampled:
+                brightness = brightness[:sampled]
+                contrast = contrast[:sampled]
+                frame_analysis = {
+                    "frames_analyzed": sampled,
+                    "sample_interval": sample_interval,
+                    "avg_brightness": round(float(np.mean(brightness)), 2),
+                    "avg_contrast": round(float(np.mean(contrast)), 2),
+                    "brightness_variation": round(float(np.std(brightness)), 2)
+                }
+
+            motion_analysis = {}
+            if pairs:
+                motion = motion[:pairs]
+                avg_score = float(np.mean(motion))
+                if avg_score > 20:
+                    motion_level = "High"
+                elif avg_score > 5:
+                    motion_level = "Medium"
+                else:
+                    motion_level = "Low"
+                motion_analysis = {
+                    "frame_pairs_analyzed": pairs,
+                    "avg_motion_score": round(avg_score, 2),
+                    "max_motion_score": round(float(np.max(motion)), 2),
+                    "motion_level": motion_level
+                }
+
+            scene_analysis = {
+                "scene_count": len(scene_changes) + 1,
+                "scene_changes": scene_changes[:20],
+                "threshold": scene_threshold
+            }
+
+            return frame_analysis, motion_analysis, scene_analysis
+
+        except Exception as e:
+            self.logger.error(f"Error in single-pass analysis: {e}")
+            return {}, {}, {}
+
+    def extract_frames(self, video_path: str, output_dir: Optional[str] = None,
+                       interval_seconds: Optional[int] = None) -> Dict:
+        """Extract frames at a fixed interval into JPEG files
+
+        Skipped frames are consumed with grab() — decode-only, no BGR
+        conversion and no copy into Python — and the full retrieve()
+        happens only at the frames actually written. When the interval
+        spans more than ~250 frames a CAP_PROP_POS_FRAMES seek is
+        cheaper than grabbing through the gap, so the loop seeks instead.
+        """
+        try:
+            is_valid, message = self.config.validate_file(video_path, "video")
+            if not is_valid:
+                return {"success": False, "message": message, "frames": []}
+
+            if not OPENCV_AVAILABLE:
+                return {
+                    "success": False,
+                    "message": "OpenCV not available for frame extraction",
+                    "frames": []
+                }
+
+            if interval_seconds is None:
+                interval_seconds = self.config.VIDEO_FRAME_EXTRACT_INTERVAL
+            if output_dir is None:
+                output_dir = self.config.TEMP_DIR
+            os.makedirs(output_dir, exist_ok=True)
+
+            base_name = os.path.splitext(os.path.basename(video_path))[0]
+
+            cap = self._open_capture(video_path)
+            saved_frames = []
+            try:
+                fps = cap.get(cv2.CAP_PROP_FPS)
+                total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                frame_interval = max(1, int((fps if fps > 0 else 30) * interval_seconds))
+                seek_gaps = frame_interval > 250
+
+                # JPEG encoding (libjpeg releases the GIL) runs on pool
+                # threads so it overlaps the decode loop instead of
+                # blocking it for 20-40 ms per 1080p frame. retrieve()
+                # allocates a fresh buffer per call, so the submitted
+                # frames need no defensive copy.
+                pending = []
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    frame_count = 0
+                    while frame_count < total_frames:
+                        if seek_gaps and frame_count > 0:
+                            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count)
+                        if not cap.grab():
+                            break
+                        if frame_count % frame_interval == 0:
+                            ret, frame = cap.retrieve()
+                            if ret:
+                                output_path = os.path.join(
+                                    output_dir, f"{base_name}_frame_{frame_count}.jpg"
+                                )
+                                pending.append(
+                                    (output_path, pool.submit(cv2.imwrite, output_path, frame))
+                                )
+                        frame_count += frame_interval if seek_gaps else 1
+
+                saved_frames = [path for path, future in pending if future.result()]
+            finally:
+                cap.release()
+
+            return {
+                "success": True,
+                "file_path": video_path,
+                "interval_seconds": interval_seconds,
+                "frames_extracted": len(saved_frames),
+                "frames": saved_frames
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error extracting frames from '{video_path}': {e}")
+            return {
+                "success": False,
+                "message": f"Error extracting frames: {str(e)}",
+                "frames": []
+            }
+
+    def create_thumbnail(self, video_path: str, output_path: Optional[str] = None,
+                         timestamp: float = 1.0, max_size: int = 320) -> Dict:
+        """Write a JPEG thumbnail of the frame nearest to a timestamp
+
+        Seeks by CAP_PROP_POS_MSEC, which lets FFmpeg jump to the
+        keyframe nearest the requested time and decode only the handful
+        of frames inside that GOP — instead of grabbing every frame from
+        the start of the file up to the target.
+        """
+        try:
+            is_valid, message = self.config.validate_file(video_path, "video")
+            if not is_valid:
+                return {"success": False, "message": message}
+
+            if not OPENCV_AVAILABLE:
+                return {
+                    "success": False,
+                    "message": "OpenCV not available for thumbnail creation"
+                }
+
+            if output_path is None:
+                base_name = os.path.splitext(os.path.basename(video_path))[0]
+                output_path = os.path.join(self.config.TEMP_DIR, f"{base_name}_thumb.jpg")
+
+            cap = self._open_capture(video_path)
+            try:
+                cap.set(cv2.CAP_PROP_POS_MSEC, timestamp * 1000)
+                ret, frame = cap.read()
+                if not ret:
+                    # Timestamp past the end (or seek unsupported): fall
+                    # back to the first frame
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    ret, frame = cap.read()
+            finally:
+                cap.release()
+
+            if not ret:
+                return {"success": False, "message": "Could not decode a frame for the thumbnail"}
+
+            h, w = frame.shape[:2]
+            scale = max_size / max(h, w)
+            if scale < 1.0:
+                frame = cv2.resize(frame, (int(w * scale), int(h * scale)),
+                                   interpolation=cv2.INTER_AREA)
+
+            if not cv2.imwrite(output_path, frame):
+                return {"success": False, "message": f"Could not write thumbnail to '{output_path}'"}
+
+            return {
+                "success": True,
+                "file_path": video_path,
+                "thumbnail_path": output_path,
+                "timestamp": timestamp,
+                "size": f"{frame.shape[1]}x{frame.shape[0]}"
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error creating thumbnail for '{video_path}': {e}")
+            return {"success": False, "message": f"Error creating thumbnail: {str(e)}"}
+
     def _format_duration(self, seconds: float) -> str:
         """Format duration in HH:MM:SS format"""
         try:
@@ -183,14 +525,23 @@ class VideoAnalysis:
             return "00:00:00"
     
     def _analyze_audio(self, video_path: str) -> Dict:
-        """Analyze audio track of the video"""
+        """Analyze audio track of the video
+
+        Prefers one ffprobe JSON call over MoviePy: constructing a
+        VideoFileClip drags in imageio/proglog and fully parses the
+        container just to read the sample rate and channel count.
+        """
+        audio_info = self._probe_audio_ffprobe(video_path)
+        if audio_info is not None:
+            return audio_info
+
         try:
             if not MOVIEPY_AVAILABLE:
                 return {
-                    "has_audio": False, 
+                    "has_audio": False,
                     "error": "MoviePy not available for audio analysis"
                 }
-            
+
             # Use moviepy to extract audio information
             clip = VideoFileClip(video_path)
             
@@ -210,4 +561,39 @@ class VideoAnalysis:
             
         except Exception as e:
             self.logger.error(f"Error analyzing audio: {e}")
-            return {"has_audio": False, "error": str(e)}
\ No newline at end of file
+            return {"has_audio": False, "error": str(e)}
+
+    def _probe_audio_ffprobe(self, video_path: str) -> Optional[Dict]:
+        """Read audio stream metadata with ffprobe, or None if unavailable"""
+        if FFPROBE_PATH is None:
+            return None
+        try:
+            result = subprocess.run(
+                [FFPROBE_PATH, "-v", "quiet", "-print_format", "json",
+                 "-show_format", "-show_streams", video_path],
+                capture_output=True, timeout=30
+            )
+            if result.returncode != 0:
+                return None
+            data = json.loads(result.stdout)
+        except (OSError, subprocess.TimeoutExpired, ValueError) as e:
+            self.logger.error(f"ffprobe failed for '{video_path}': {e}")
+            return None
+
+        audio_stream = next(
+            (s for s in data.get("streams", []) if s.get("codec_type") == "audio"),
+            None
+        )
+        duration = float(data.get("format", {}).get("duration", 0) or 0)
+
+        audio_info = {
+            "has_audio": audio_stream is not None,
+            "duration": round(duration, 2)
+        }
+        if audio_stream is not None:
+            sample_rate = audio_stream.get("sample_rate")
+            audio_info.update({
+                "sample_rate": int(sample_rate) if sample_rate else None,
+                "channels": audio_stream.get("channels")
+            })
+        return audio_info
\ No newline at end of file
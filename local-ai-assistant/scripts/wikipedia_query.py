@@ -3,8 +3,11 @@ Wikipedia Query Module
 Handles Wikipedia searches and content retrieval
 """
 
+import collections
+import threading
 import wikipedia
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import logging
 import sys
@@ -12,14 +15,70 @@ import os
 
 # Add parent directory to path for importing config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import Config
+from config import get_config
+
+# The wikipedia library fires every API call through module-level
+# requests.get, opening a fresh TCP+TLS connection each time. A pooled
+# Session exposes the same .get signature, so routing the library's
+# `requests` reference through it gives keep-alive reuse across calls.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4))
+if hasattr(wikipedia, "wikipedia") and hasattr(wikipedia.wikipedia, "requests"):
+    wikipedia.wikipedia.requests = _SESSION
 
 class WikipediaQuery:
+    # Most recent queries/pages memoized per language; repeated UI
+    # queries dominate assistant workloads, and a cache hit turns a
+    # ~200 ms network round-trip into a dict lookup
+    _CACHE_SIZE = 1024
+
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         wikipedia.set_lang(self.config.WIKIPEDIA_LANGUAGE)
         self.logger = logging.getLogger(__name__)
-    
+        self._search_cache = collections.OrderedDict()
+        self._page_cache = collections.OrderedDict()
+        self._suggest_cache = collections.OrderedDict()
+
+    @staticmethod
+    def _cache_get(cache: collections.OrderedDict, key):
+        """LRU lookup: hits move to the back so eviction drops the coldest"""
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        return None
+
+    @classmethod
+    def _cache_put(cls, cache: collections.OrderedDict, key, value):
+        cache[key] = value
+        if len(cache) > cls._CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop memoized search and page results (e.g. after a language change)"""
+        self._search_cache.clear()
+        self._page_cache.clear()
+        self._suggest_cache.clear()
+
+    def warmup(self):
+        """Open the keep-alive connection in the background
+
+        A HEAD to the API endpoint primes DNS and the TLS handshake on
+        the pooled session, so the first real query only pays for the
+        request itself. Fire-and-forget; failures just mean the first
+        query warms the pool instead.
+        """
+        def _prime():
+            try:
+                _SESSION.head(
+                    f"https://{self.config.WIKIPEDIA_LANGUAGE}.wikipedia.org/w/api.php",
+                    timeout=5
+                )
+            except requests.RequestException:
+                pass
+
+        threading.Thread(target=_prime, daemon=True).start()
+
     def search(self, query: str, max_results: Optional[int] = None) -> Dict:
         """
         Search Wikipedia for the given query
@@ -34,7 +93,12 @@ class WikipediaQuery:
         try:
             if max_results is None:
                 max_results = self.config.WIKIPEDIA_MAX_RESULTS
-            
+
+            cache_key = (query, max_results, self.config.WIKIPEDIA_LANGUAGE)
+            cached = self._cache_get(self._search_cache, cache_key)
+            if cached is not None:
+                return cached
+
             # Search for pages
             search_results = wikipedia.search(query, results=max_results)
             
@@ -45,33 +109,24 @@ class WikipediaQuery:
                     "results": []
                 }
             
-            results = []
-            for title in search_results:
-                try:
-                    page_info = self.get_page_info(title)
-                    if page_info:
-                        results.append(page_info)
-                except wikipedia.exceptions.DisambiguationError as e:
-                    # Handle disambiguation pages
-                    self.logger.warning(f"Disambiguation error for '{title}': {e}")
-                    if e.options:
-                        # Try the first option
-                        try:
-                            page_info = self.get_page_info(e.options[0])
-                            if page_info:
-                                results.append(page_info)
-                        except Exception:
-                            continue
-                except Exception as e:
-                    self.logger.error(f"Error processing page '{title}': {e}")
-                    continue
-            
-            return {
+            # The per-title fetches are independent blocking HTTPS
+            # round-trips, so issue them concurrently and keep the
+            # result order of the search listing.
+            if len(search_results) == 1:
+                fetched = [self._fetch_result(search_results[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(search_results), 8)) as pool:
+                    fetched = list(pool.map(self._fetch_result, search_results))
+            results = [page_info for page_info in fetched if page_info]
+
+            response = {
                 "success": True,
                 "query": query,
                 "total_results": len(results),
                 "results": results
             }
+            self._cache_put(self._search_cache, cache_key, response)
+            return response
             
         except Exception as e:
             self.logger.error(f"Error searching Wikipedia: {e}")
@@ -81,6 +136,46 @@ class WikipediaQuery:
                 "results": []
             }
     
+    def _fetch_result(self, title: str) -> Optional[Dict]:
+        """Fetch one search result's page info, resolving disambiguations"""
+        try:
+            return self.get_page_info(title)
+        except wikipedia.exceptions.DisambiguationError as e:
+            # Handle disambiguation pages by trying the first option
+            self.logger.warning(f"Disambiguation error for '{title}': {e}")
+            if e.options:
+                try:
+                    return self.get_page_info(e.options[0])
+                except Exception:
+                    return None
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing page '{title}': {e}")
+            return None
+
+    def search_many(self, queries: List[str], max_results: Optional[int] = None) -> List[Dict]:
+        """
+        Search Wikipedia for several queries in one batch
+
+        Issues the per-query searches concurrently so a batched caller
+        (e.g. a Gradio handler with batch=True) pays one round-trip of
+        latency instead of len(queries).
+
+        Args:
+            queries (List[str]): Search queries
+            max_results (int): Maximum number of results per query
+
+        Returns:
+            List[Dict]: One search result dict per query, in input order
+        """
+        if not queries:
+            return []
+        if len(queries) == 1:
+            return [self.search(queries[0], max_results)]
+
+        with ThreadPoolExecutor(max_workers=min(len(queries), 8)) as pool:
+            return list(pool.map(lambda q: self.search(q, max_results), queries))
+
     def get_page_info(self, title: str) -> Optional[Dict]:
         """
         Get detailed information about a Wikipedia page
@@ -91,10 +186,15 @@ class WikipediaQuery:
         Returns:
             Dict: Page information including summary, URL, etc.
         """
+        cache_key = (title, self.config.WIKIPEDIA_LANGUAGE)
+        cached = self._cache_get(self._page_cache, cache_key)
+        if cached is not None:
+            return cached
+
         try:
             page = wikipedia.page(title, auto_suggest=self.config.WIKIPEDIA_AUTO_SUGGEST)
-            
-            return {
+
+            page_info = {
                 "title": page.title,
                 "summary": wikipedia.summary(title, sentences=3),
                 "url": page.url,
@@ -102,7 +202,9 @@ class WikipediaQuery:
                 "images": page.images[:3] if page.images else [],
                 "references": page.references[:5] if page.references else []
             }
-            
+            self._cache_put(self._page_cache, cache_key, page_info)
+            return page_info
+
         except wikipedia.exceptions.PageError:
             self.logger.warning(f"Page not found: {title}")
             return None
@@ -141,9 +243,17 @@ class WikipediaQuery:
             Dict: Search results with suggestions
         """
         try:
-            # Try to get suggestions first
-            suggestions = wikipedia.suggest(query)
-            
+            # Try to get suggestions first; the suggestion for a query is
+            # as cacheable as its search results, so memoize it the same
+            # way (truthy values only — a miss and "no suggestion" both
+            # re-probe, which keeps the cache free of ambiguous Nones)
+            cache_key = (query, self.config.WIKIPEDIA_LANGUAGE)
+            suggestions = self._cache_get(self._suggest_cache, cache_key)
+            if suggestions is None:
+                suggestions = wikipedia.suggest(query)
+                if suggestions:
+                    self._cache_put(self._suggest_cache, cache_key, suggestions)
+
             if suggestions and suggestions != query:
                 return {
                     "original_query": query,
@@ -199,7 +309,8 @@ class WikipediaQuery:
         """
         try:
             wikipedia.set_lang(language)
-            self.config.WIKIPEDIA_LANGUAGE = language
+            self.config = self.config.replace(WIKIPEDIA_LANGUAGE=language)
+            self.clear_cache()
             return True
         except Exception as e:
             self.logger.error(f"Error setting language to '{language}': {e}")